@@ -134,7 +134,7 @@ def planner_payload_from_meta(meta_json: str) -> Optional[Dict[str, object]]:
     return payload
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class RobotState:
     x: float
     y: float
@@ -142,7 +142,7 @@ class RobotState:
     speed: float
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class Obstacle:
     center_x: float
     center_y: float
@@ -151,7 +151,7 @@ class Obstacle:
     body_id: int
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class WheelCommand:
     left_rad_s: float
     right_rad_s: float
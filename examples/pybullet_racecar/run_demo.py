@@ -3,10 +3,14 @@ from __future__ import annotations
 
 import argparse
 import dataclasses
+import functools
 import importlib
 import json
 import math
+import multiprocessing
+import operator
 import platform
+import queue
 import random
 import subprocess
 import sys
@@ -18,6 +22,11 @@ from typing import Any, Dict, List, Optional, Sequence, Set, Tuple
 import pybullet as p
 import pybullet_data
 
+try:
+    import orjson
+except ModuleNotFoundError:  # pragma: no cover - optional faster JSON codec
+    orjson = None  # type: ignore[assignment]
+
 
 SCHEMA_VERSION = "racecar_demo.v1"
 PLANNER_SCHEMA_VERSION = "planner.v1"
@@ -38,10 +47,22 @@ REQUIRED_LOG_FIELDS = {
     "goal_reached",
 }
 OPTIONAL_LOG_FIELDS = {"bt", "planner", "shared_action"}
+ALLOWED_LOG_FIELDS = frozenset(REQUIRED_LOG_FIELDS | OPTIONAL_LOG_FIELDS)
 
 STEERING_JOINTS = (4, 6)
 DRIVE_JOINTS = (2, 3, 5, 7)
 
+RAY_ANGLES_DEG = (-45.0, -25.0, -10.0, 0.0, 10.0, 25.0, 45.0)
+RAY_LENGTH = 3.0
+
+STATUS_TEXT_COLOR = (0.95, 0.95, 0.95)
+
+# Pacing residuals below this are carried to the next step instead of paying for a sleep call.
+MIN_PACING_SLEEP_NS = 500_000
+
+# getContactPoints tuples carry the other body's unique id at index 2.
+_contact_body_b = operator.itemgetter(2)
+
 
 def clamp(value: float, lo: float, hi: float) -> float:
     return max(lo, min(hi, value))
@@ -94,21 +115,29 @@ def now_utc_iso8601() -> str:
     return time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime())
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True, frozen=True)
 class Action:
     steering: float
     throttle: float
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True, frozen=True)
 class CarState:
     x: float
     y: float
     yaw: float
     speed: float
+    # Heading trig computed once in car_state() and reused by the raycast.
+    cos_yaw: float = dataclasses.field(repr=False, compare=False)
+    sin_yaw: float = dataclasses.field(repr=False, compare=False)
+
 
+def _state_dict(state: CarState) -> Dict[str, float]:
+    # Flat field copy; dataclasses.asdict recurses and deep-copies every value.
+    return {"x": state.x, "y": state.y, "yaw": state.yaw, "speed": state.speed}
 
-@dataclasses.dataclass
+
+@dataclasses.dataclass(slots=True)
 class Obstacle:
     center_x: float
     center_y: float
@@ -116,26 +145,89 @@ class Obstacle:
     half_y: float
     body_id: int
 
+
 class JsonlSink:
-    def __init__(self, path: Path) -> None:
+    def __init__(self, path: Path, flush_interval_s: float = 0.1, buffer_bytes: int = 64 * 1024) -> None:
         self.path = path
         self.path.parent.mkdir(parents=True, exist_ok=True)
-        self._file = self.path.open("a", encoding="utf-8")
+        self._file = self.path.open("a", encoding="utf-8", buffering=buffer_bytes)
+        self._flush_interval_s = flush_interval_s
+        self._last_flush = time.monotonic()
 
     def write(self, record: Dict[str, object]) -> None:
-        self._file.write(json.dumps(record, separators=(",", ":"), ensure_ascii=True))
-        self._file.write("\n")
-        self._file.flush()
+        self.write_many((record,))
+
+    def write_many(self, records: Sequence[Dict[str, object]]) -> None:
+        # Stdlib encoding keeps the log format stable (NaN/Infinity tokens, ASCII escapes).
+        self._file.write(
+            "".join([json.dumps(record, separators=(",", ":"), ensure_ascii=True) + "\n" for record in records])
+        )
+        # Flush on a wall-clock cadence rather than per record; close() flushes the tail.
+        now = time.monotonic()
+        if now - self._last_flush >= self._flush_interval_s:
+            self._file.flush()
+            self._last_flush = now
 
     def close(self) -> None:
         self._file.close()
 
 
+class BackgroundLogWriter:
+    """Validates and writes log records on a worker thread, off the physics loop."""
+
+    def __init__(self, sink: JsonlSink, maxsize: int = 4096, batch_size: int = 64) -> None:
+        self.sink = sink
+        self._batch_size = batch_size
+        self._queue: "queue.Queue[Optional[Dict[str, object]]]" = queue.Queue(maxsize=maxsize)
+        self._error: Optional[BaseException] = None
+        self._thread = threading.Thread(target=self._drain, name="racecar-log-writer", daemon=True)
+        self._thread.start()
+
+    def write(self, record: Dict[str, object]) -> None:
+        # Fail the run on the first write after a worker error rather than losing records silently.
+        if self._error is not None:
+            raise self._error
+        # Blocks only if the writer falls a full queue behind; records are never dropped.
+        self._queue.put(record)
+
+    def close(self) -> None:
+        self._queue.put(None)
+        self._thread.join()
+        self.sink.close()
+        if self._error is not None:
+            raise self._error
+
+    def _drain(self) -> None:
+        done = False
+        while not done:
+            # Take whatever has queued up (up to batch_size) and encode it as one file write.
+            batch = [self._queue.get()]
+            while len(batch) < self._batch_size:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            if batch[-1] is None:
+                batch.pop()
+                done = True
+            if self._error is not None or not batch:
+                continue
+            try:
+                for record in batch:
+                    validate_log_record_v1(record)
+                self.sink.write_many(batch)
+            except BaseException as exc:  # surfaced to the caller from close()
+                self._error = exc
+
+
 def validate_log_record_v1(record: Dict[str, object]) -> None:
-    missing = REQUIRED_LOG_FIELDS.difference(record.keys())
+    keys = record.keys()
+    if record.get("schema_version") == SCHEMA_VERSION and keys >= REQUIRED_LOG_FIELDS and keys <= ALLOWED_LOG_FIELDS:
+        return
+    missing = REQUIRED_LOG_FIELDS - keys
     if missing:
         raise ValueError(f"racecar_demo.v1 missing required fields: {sorted(missing)}")
-    extra = set(record.keys()).difference(REQUIRED_LOG_FIELDS.union(OPTIONAL_LOG_FIELDS))
+    extra = keys - ALLOWED_LOG_FIELDS
     if extra:
         raise ValueError(f"racecar_demo.v1 unexpected top-level fields: {sorted(extra)}")
     if record.get("schema_version") != SCHEMA_VERSION:
@@ -159,11 +251,12 @@ def get_git_commit(repo_root: Path) -> str:
 def car_state(client_id: int, car_id: int) -> CarState:
     position, orientation = p.getBasePositionAndOrientation(car_id, physicsClientId=client_id)
     linear_velocity, _ = p.getBaseVelocity(car_id, physicsClientId=client_id)
-    yaw = p.getEulerFromQuaternion(orientation)[2]
+    qx, qy, qz, qw = orientation
+    yaw = math.atan2(2.0 * (qw * qz + qx * qy), 1.0 - 2.0 * (qy * qy + qz * qz))
     forward_x = math.cos(yaw)
     forward_y = math.sin(yaw)
     speed = (linear_velocity[0] * forward_x) + (linear_velocity[1] * forward_y)
-    return CarState(x=position[0], y=position[1], yaw=yaw, speed=speed)
+    return CarState(x=position[0], y=position[1], yaw=yaw, speed=speed, cos_yaw=forward_x, sin_yaw=forward_y)
 
 
 def apply_action(
@@ -174,30 +267,40 @@ def apply_action(
     steering_force: float,
     drive_force: float,
 ) -> None:
-    steering = clamp(action.steering, -1.0, 1.0)
-    throttle = clamp(action.throttle, -1.0, 1.0)
+    apply_motor_command(client_id, car_id, action.steering, action.throttle, max_speed, steering_force, drive_force)
+
+
+def apply_motor_command(
+    client_id: int,
+    car_id: int,
+    steering: float,
+    throttle: float,
+    max_speed: float,
+    steering_force: float,
+    drive_force: float,
+) -> None:
+    steering = clamp(steering, -1.0, 1.0)
+    throttle = clamp(throttle, -1.0, 1.0)
     target_velocity = max_speed * throttle
     target_steer = 0.55 * steering
 
-    for joint in STEERING_JOINTS:
-        p.setJointMotorControl2(
-            car_id,
-            joint,
-            p.POSITION_CONTROL,
-            targetPosition=target_steer,
-            force=steering_force,
-            physicsClientId=client_id,
-        )
-
-    for joint in DRIVE_JOINTS:
-        p.setJointMotorControl2(
-            car_id,
-            joint,
-            p.VELOCITY_CONTROL,
-            targetVelocity=target_velocity,
-            force=drive_force,
-            physicsClientId=client_id,
-        )
+    # One array call per joint group instead of one setJointMotorControl2 call per joint.
+    p.setJointMotorControlArray(
+        car_id,
+        STEERING_JOINTS,
+        p.POSITION_CONTROL,
+        targetPositions=[target_steer] * len(STEERING_JOINTS),
+        forces=[steering_force] * len(STEERING_JOINTS),
+        physicsClientId=client_id,
+    )
+    p.setJointMotorControlArray(
+        car_id,
+        DRIVE_JOINTS,
+        p.VELOCITY_CONTROL,
+        targetVelocities=[target_velocity] * len(DRIVE_JOINTS),
+        forces=[drive_force] * len(DRIVE_JOINTS),
+        physicsClientId=client_id,
+    )
 
 
 def update_follow_camera(
@@ -256,39 +359,43 @@ def add_goal_marker(client_id: int, goal_xy: Tuple[float, float]) -> int:
     )
 
 
+@functools.lru_cache(maxsize=4)
+def ray_direction_table(ray_angles_deg: Tuple[float, ...]) -> Tuple[Tuple[float, float], ...]:
+    return tuple((math.cos(math.radians(angle_deg)), math.sin(math.radians(angle_deg))) for angle_deg in ray_angles_deg)
+
+
 def raycast_observation(
     client_id: int,
     state: CarState,
     ray_angles_deg: Sequence[float],
     ray_length: float,
 ) -> Tuple[List[float], List[Tuple[Tuple[float, float, float], Tuple[float, float, float], float]]]:
-    rays_from = []
+    ray_z = 0.20
+    x = state.x
+    y = state.y
+    base_from = (x, y, ray_z)
+    # Rotate the fixed per-ray unit directions by yaw instead of evaluating trig for every ray.
+    cos_yaw = state.cos_yaw
+    sin_yaw = state.sin_yaw
+    deltas: List[Tuple[float, float]] = []
     rays_to = []
-    base_from = (state.x, state.y, 0.20)
-    for angle_deg in ray_angles_deg:
-        angle = state.yaw + math.radians(angle_deg)
-        end = (
-            state.x + ray_length * math.cos(angle),
-            state.y + ray_length * math.sin(angle),
-            0.20,
-        )
-        rays_from.append(base_from)
-        rays_to.append(end)
+    for cos_a, sin_a in ray_direction_table(tuple(ray_angles_deg)):
+        dx = ray_length * (cos_yaw * cos_a - sin_yaw * sin_a)
+        dy = ray_length * (sin_yaw * cos_a + cos_yaw * sin_a)
+        deltas.append((dx, dy))
+        rays_to.append((x + dx, y + dy, ray_z))
+    rays_from = [base_from] * len(rays_to)
 
     results = p.rayTestBatch(rays_from, rays_to, physicsClientId=client_id)
     distances: List[float] = []
     segments: List[Tuple[Tuple[float, float, float], Tuple[float, float, float], float]] = []
-    for ray_from, ray_to, result in zip(rays_from, rays_to, results):
+    # Rays are horizontal, so hit points only need the planar offset scaled by the hit fraction.
+    for (dx, dy), result in zip(deltas, results):
         fraction = result[2]
         if fraction < 0.0:
             fraction = 1.0
         distances.append(ray_length * fraction)
-        hit = (
-            ray_from[0] + (ray_to[0] - ray_from[0]) * fraction,
-            ray_from[1] + (ray_to[1] - ray_from[1]) * fraction,
-            ray_from[2] + (ray_to[2] - ray_from[2]) * fraction,
-        )
-        segments.append((ray_from, hit, fraction))
+        segments.append((base_from, (x + dx * fraction, y + dy * fraction, ray_z), fraction))
     return distances, segments
 
 
@@ -490,8 +597,34 @@ def build_muesli_bt_dsl(mode: str, args: argparse.Namespace) -> str:
             "    (seq (cond collision-imminent) (act avoid-obstacle rays action) (running)) "
             "    (seq (act drive-to-goal goal action) (act apply-action action) (running))))"
         )
+    if mode in ("bt_planner", "bt_flagship"):
+        return _planner_bt_dsl(
+            mode,
+            max(1, int(round(args.budget_ms))),
+            int(args.work_max),
+            int(args.max_depth),
+            float(args.gamma),
+            float(args.pw_k),
+            float(args.pw_alpha),
+            max(1, int(args.root_parallel)),
+        )
+    raise ValueError(f"Unsupported BT mode: {mode}")
+
+
+@functools.lru_cache(maxsize=8)
+def _planner_bt_dsl(
+    mode: str,
+    budget_ms: int,
+    work_max: int,
+    max_depth: int,
+    gamma: float,
+    pw_k: float,
+    pw_alpha: float,
+    root_parallel: int,
+) -> str:
+    # Only emitted when enabled so the default trees match the checked-in DSL mirrors.
+    root_parallel_opt = f":root_parallel {root_parallel} " if root_parallel > 1 else ""
     if mode == "bt_planner":
-        budget_ms = max(1, int(round(args.budget_ms)))
         return (
             "(sel "
             "  (seq (cond goal-reached-racecar) (succeed)) "
@@ -502,11 +635,11 @@ def build_muesli_bt_dsl(mode: str, args: argparse.Namespace) -> str:
             "        :name \"racecar-plan\" "
             "        :planner \"mcts\" "
             f"        :budget_ms {budget_ms} "
-            f"        :work_max {int(args.work_max)} "
-            f"        :max_depth {int(args.max_depth)} "
-            f"        :gamma {float(args.gamma)} "
-            f"        :pw_k {float(args.pw_k)} "
-            f"        :pw_alpha {float(args.pw_alpha)} "
+            f"        :work_max {work_max} "
+            f"        :max_depth {max_depth} "
+            f"        :gamma {gamma} "
+            f"        :pw_k {pw_k} "
+            f"        :pw_alpha {pw_alpha} {root_parallel_opt}"
             "        :model_service \"racecar-kinematic-v1\" "
             "        :state_key state "
             "        :action_key action "
@@ -515,43 +648,55 @@ def build_muesli_bt_dsl(mode: str, args: argparse.Namespace) -> str:
             "      (act apply-action action) "
             "      (running))))"
         )
-    if mode == "bt_flagship":
-        budget_ms = max(1, int(round(args.budget_ms)))
-        return (
-            "(sel "
-            "  (seq (cond bb-truthy goal_reached) (succeed)) "
-            "  (seq "
-            "    (cond bb-truthy collision_imminent) "
-            "    (act select-action act_avoid 1 action_cmd) "
-            "    (running)) "
-            "  (seq "
-            "    (plan-action "
-            "      :name \"goal-plan\" "
-            "      :planner \"mcts\" "
-            f"      :budget_ms {budget_ms} "
-            f"      :work_max {int(args.work_max)} "
-            f"      :max_depth {int(args.max_depth)} "
-            f"      :gamma {float(args.gamma)} "
-            f"      :pw_k {float(args.pw_k)} "
-            f"      :pw_alpha {float(args.pw_alpha)} "
-            "      :model_service \"flagship-goal-shared-v1\" "
-            "      :state_key planner_state "
-            "      :action_key planner_action "
-            "      :meta_key plan-meta "
-            "      :action_schema \"flagship.cmd.v1\" "
-            "      :top_k 5) "
-            "    (act select-action planner_action 2 action_cmd) "
-            "    (running)) "
-            "  (seq "
-            "    (act select-action act_goal_direct 3 action_cmd) "
-            "    (running)))"
-        )
-    raise ValueError(f"Unsupported BT mode: {mode}")
+    return (
+        "(sel "
+        "  (seq (cond bb-truthy goal_reached) (succeed)) "
+        "  (seq "
+        "    (cond bb-truthy collision_imminent) "
+        "    (act select-action act_avoid 1 action_cmd) "
+        "    (running)) "
+        "  (seq "
+        "    (plan-action "
+        "      :name \"goal-plan\" "
+        "      :planner \"mcts\" "
+        f"      :budget_ms {budget_ms} "
+        f"      :work_max {work_max} "
+        f"      :max_depth {max_depth} "
+        f"      :gamma {gamma} "
+        f"      :pw_k {pw_k} "
+        f"      :pw_alpha {pw_alpha} {root_parallel_opt}"
+        "      :model_service \"flagship-goal-shared-v1\" "
+        "      :state_key planner_state "
+        "      :action_key planner_action "
+        "      :meta_key plan-meta "
+        "      :action_schema \"flagship.cmd.v1\" "
+        "      :top_k 5) "
+        "    (act select-action planner_action 2 action_cmd) "
+        "    (running)) "
+        "  (seq "
+        "    (act select-action act_goal_direct 3 action_cmd) "
+        "    (running)))"
+    )
+
+
+def _json_loads(text: str) -> object:
+    if orjson is not None:
+        try:
+            return orjson.loads(text)
+        except orjson.JSONDecodeError:
+            pass  # e.g. NaN/Infinity tokens, which only the stdlib parser accepts
+    return json.loads(text)
+
+
+def _json_dumps_indent(obj: object) -> str:
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode("utf-8")
+    return json.dumps(obj, indent=2)
 
 
 def planner_payload_from_meta(meta_json: str) -> Optional[Dict[str, object]]:
     try:
-        meta = json.loads(meta_json)
+        meta = _json_loads(meta_json)
     except Exception:
         return None
     if not isinstance(meta, dict):
@@ -601,7 +746,7 @@ class BridgeRacecarSimAdapter:
         car_id: int,
         goal_xy: Tuple[float, float],
         obstacles: Sequence[Obstacle],
-        sink: JsonlSink,
+        sink: BackgroundLogWriter,
         run_id: str,
         mode: str,
         max_speed: float,
@@ -609,6 +754,7 @@ class BridgeRacecarSimAdapter:
         drive_force: float,
         tick_hz: float,
         draw_debug_enabled: bool,
+        poll_keyboard: bool,
         follow_camera: bool,
         camera_distance: float,
         camera_yaw: float,
@@ -619,7 +765,7 @@ class BridgeRacecarSimAdapter:
         self.car_id = car_id
         self.goal_xy = goal_xy
         self.obstacles = list(obstacles)
-        self.obstacle_body_ids = {obs.body_id for obs in obstacles}
+        self.obstacle_body_ids = frozenset(obs.body_id for obs in self.obstacles)
         self.sink = sink
         self.run_id = run_id
         self.mode = mode
@@ -628,20 +774,37 @@ class BridgeRacecarSimAdapter:
         self.drive_force = drive_force
         self.tick_hz = tick_hz
         self.draw_debug_enabled = draw_debug_enabled
+        self.poll_keyboard = poll_keyboard
         self.follow_camera = follow_camera
         self.camera_distance = camera_distance
         self.camera_yaw = camera_yaw
         self.camera_pitch = camera_pitch
         self.camera_target_z = camera_target_z
 
-        self.ray_angles = [-45.0, -25.0, -10.0, 0.0, 10.0, 25.0, 45.0]
-        self.ray_length = 3.0
+        self.ray_angles = RAY_ANGLES_DEG
+        self.ray_length = RAY_LENGTH
         self.collision_count = 0
         self.wall_start = time.perf_counter()
         self.debug_items: List[int] = []
         self._last_state: Optional[CarState] = None
         self._last_ray_segments: List[Tuple[Tuple[float, float, float], Tuple[float, float, float], float]] = []
         self._stop_requested = False
+        # Same scheme as the manual loop: copy a fixed-order template, then fill per-tick fields.
+        self._record_base: Dict[str, object] = {
+            "schema_version": SCHEMA_VERSION,
+            "run_id": run_id,
+            "tick_index": None,
+            "sim_time_s": None,
+            "wall_time_s": None,
+            "mode": mode,
+            "state": None,
+            "goal": None,
+            "distance_to_goal": None,
+            "collision_imminent": None,
+            "action": None,
+            "collisions_total": None,
+            "goal_reached": None,
+        }
 
     def reset(self) -> None:
         p.resetBasePositionAndOrientation(self.car_id, [0.0, 0.0, 0.20], [0.0, 0.0, 0.0, 1.0], physicsClientId=self.client_id)
@@ -663,48 +826,48 @@ class BridgeRacecarSimAdapter:
         self._last_state = state
         self._last_ray_segments = ray_segments
         collision_imminent = min(ray_distances) < 0.9 if ray_distances else False
-        state_vec = [
-            float(state.x),
-            float(state.y),
-            float(state.yaw),
-            float(state.speed),
-            float(self.goal_xy[0]),
-            float(self.goal_xy[1]),
-            *[float(v) for v in ray_distances],
-        ]
+        # Car state, goal and ray distances are already Python floats; avoid per-tick recasts.
+        goal_x, goal_y = self.goal_xy
         return {
             "state_schema": "racecar_state.v1",
-            "state_vec": state_vec,
-            "x": float(state.x),
-            "y": float(state.y),
-            "yaw": float(state.yaw),
-            "speed": float(state.speed),
-            "rays": [float(v) for v in ray_distances],
-            "goal": [float(self.goal_xy[0]), float(self.goal_xy[1])],
-            "collision_imminent": bool(collision_imminent),
-            "collision_count": int(self.collision_count),
+            "state_vec": [state.x, state.y, state.yaw, state.speed, goal_x, goal_y, *ray_distances],
+            "x": state.x,
+            "y": state.y,
+            "yaw": state.yaw,
+            "speed": state.speed,
+            "rays": ray_distances,
+            "goal": [goal_x, goal_y],
+            "collision_imminent": collision_imminent,
+            "collision_count": self.collision_count,
             "t_ms": int((time.perf_counter() - self.wall_start) * 1000.0),
         }
 
     def apply_action(self, action: Tuple[float, float]) -> None:
-        steering = float(action[0])
-        throttle = float(action[1])
-        globals()["apply_action"](
+        # Straight to the motor targets: no Action allocation or module-global lookup per tick.
+        apply_motor_command(
             self.client_id,
             self.car_id,
-            Action(steering=steering, throttle=throttle),
-            max_speed=self.max_speed,
-            steering_force=self.steering_force,
-            drive_force=self.drive_force,
+            float(action[0]),
+            float(action[1]),
+            self.max_speed,
+            self.steering_force,
+            self.drive_force,
         )
 
     def step(self, steps: int) -> None:
         step_count = max(1, int(steps))
+        client_id = self.client_id
+        car_id = self.car_id
+        obstacle_body_ids = self.obstacle_body_ids
+        collisions = 0
         for _ in range(step_count):
-            p.stepSimulation(physicsClientId=self.client_id)
-            contacts = p.getContactPoints(bodyA=self.car_id, physicsClientId=self.client_id)
-            if any(cp[2] in self.obstacle_body_ids for cp in contacts):
-                self.collision_count += 1
+            p.stepSimulation(physicsClientId=client_id)
+            if not obstacle_body_ids:
+                continue
+            contacts = p.getContactPoints(bodyA=car_id, physicsClientId=client_id)
+            if not obstacle_body_ids.isdisjoint(map(_contact_body_b, contacts)):
+                collisions += 1
+        self.collision_count += collisions
         if self.follow_camera:
             self._update_camera(car_state(self.client_id, self.car_id))
 
@@ -724,6 +887,8 @@ class BridgeRacecarSimAdapter:
     def stop_requested(self) -> bool:
         if self._stop_requested:
             return True
+        if not self.poll_keyboard:
+            return False
         events = p.getKeyboardEvents(physicsClientId=self.client_id)
         esc = events.get(27, 0)
         q = events.get(ord("q"), 0)
@@ -734,27 +899,24 @@ class BridgeRacecarSimAdapter:
         return False
 
     def on_tick_record(self, payload: Dict[str, object]) -> None:
-        record: Dict[str, object] = {
-            "schema_version": SCHEMA_VERSION,
-            "run_id": self.run_id,
-            "tick_index": int(payload["tick_index"]),
-            "sim_time_s": float(payload["sim_time_s"]),
-            "wall_time_s": float(payload["wall_time_s"]),
-            "mode": self.mode,
-            "state": payload["state"],
-            "goal": payload["goal"],
-            "distance_to_goal": float(payload["distance_to_goal"]),
-            "collision_imminent": bool(payload["collision_imminent"]),
-            "action": payload["action"],
-            "collisions_total": int(payload["collisions_total"]),
-            "goal_reached": bool(payload["goal_reached"]),
-        }
+        goal_reached = bool(payload["goal_reached"])
+        record = self._record_base.copy()
+        record["tick_index"] = int(payload["tick_index"])
+        record["sim_time_s"] = float(payload["sim_time_s"])
+        record["wall_time_s"] = float(payload["wall_time_s"])
+        record["state"] = payload["state"]
+        record["goal"] = payload["goal"]
+        record["distance_to_goal"] = float(payload["distance_to_goal"])
+        record["collision_imminent"] = bool(payload["collision_imminent"])
+        record["action"] = payload["action"]
+        record["collisions_total"] = int(payload["collisions_total"])
+        record["goal_reached"] = goal_reached
 
         bt_status = payload.get("bt_status")
         if isinstance(bt_status, str):
             active_branch = payload.get("active_branch")
             branch_id = int(active_branch) if isinstance(active_branch, int) else None
-            record["bt"] = bt_log_payload(self.mode, bt_status, branch_id, bool(payload["goal_reached"]))
+            record["bt"] = bt_log_payload(self.mode, bt_status, branch_id, goal_reached)
 
         planner_meta = payload.get("planner_meta_json")
         if isinstance(planner_meta, str) and planner_meta:
@@ -765,7 +927,6 @@ class BridgeRacecarSimAdapter:
         if isinstance(shared_action, dict):
             record["shared_action"] = shared_action
 
-        validate_log_record_v1(record)
         self.sink.write(record)
 
     def _update_camera(self, state: CarState) -> None:
@@ -787,6 +948,12 @@ def parse_args() -> argparse.Namespace:
     parser.add_argument("--duration-sec", type=float, default=35.0)
     parser.add_argument("--physics-hz", type=float, default=240.0)
     parser.add_argument("--tick-hz", type=float, default=20.0)
+    parser.add_argument(
+        "--solver-iters",
+        type=int,
+        default=None,
+        help="Bullet constraint solver iterations per physics step (default: Bullet's own, 50).",
+    )
     parser.add_argument("--seed", type=int, default=7)
     parser.add_argument("--headless", action="store_true", help="Run in DIRECT mode without GUI.")
     parser.add_argument("--no-sleep", action="store_true", help="Disable wall-clock sleeps between physics steps.")
@@ -808,6 +975,12 @@ def parse_args() -> argparse.Namespace:
     parser.add_argument("--pw-k", type=float, default=2.0, help="Progressive widening k.")
     parser.add_argument("--pw-alpha", type=float, default=0.5, help="Progressive widening alpha.")
     parser.add_argument("--gamma", type=float, default=0.96, help="Planner discount factor.")
+    parser.add_argument(
+        "--root-parallel",
+        type=int,
+        default=1,
+        help="Independent MCTS root trees searched in parallel per tick (splits --work-max).",
+    )
     parser.add_argument(
         "--keyboard-backend",
         choices=("auto", "pybullet", "pynput"),
@@ -850,11 +1023,16 @@ def parse_args() -> argparse.Namespace:
     parser.add_argument("--camera-pitch", type=float, default=-35.0, help="Follow-camera pitch angle in degrees.")
     parser.add_argument("--camera-target-z", type=float, default=0.35, help="Follow-camera target Z.")
     parser.add_argument("--log-path", type=Path, default=None, help="Optional explicit JSONL log file path.")
+    parser.add_argument(
+        "--num-envs",
+        type=int,
+        default=1,
+        help="Run N headless episodes in parallel worker processes (seeds seed..seed+N-1).",
+    )
     return parser.parse_args()
 
 
-def main() -> int:
-    args = parse_args()
+def run_episode(args: argparse.Namespace) -> Dict[str, object]:
     random.seed(args.seed)
 
     root_dir = Path(__file__).resolve().parent
@@ -873,7 +1051,8 @@ def main() -> int:
     if client_id < 0:
         raise RuntimeError("Failed to connect to PyBullet.")
 
-    sink = JsonlSink(log_path)
+    sink = BackgroundLogWriter(JsonlSink(log_path))
+    episode_failed = False
     config_for_metadata = {
         key: (str(value) if isinstance(value, Path) else value)
         for key, value in vars(args).items()
@@ -890,12 +1069,17 @@ def main() -> int:
         "seed": args.seed,
         "config": config_for_metadata,
     }
-    metadata_path.write_text(json.dumps(metadata, indent=2), encoding="utf-8")
+    metadata_path.write_text(_json_dumps_indent(metadata), encoding="utf-8")
 
     try:
+        if not args.headless:
+            # Avoid re-rendering the GUI scene after every body that gets loaded below.
+            p.configureDebugVisualizer(p.COV_ENABLE_RENDERING, 0, physicsClientId=client_id)
         p.setAdditionalSearchPath(pybullet_data.getDataPath(), physicsClientId=client_id)
         p.setGravity(0.0, 0.0, -9.81, physicsClientId=client_id)
         p.setTimeStep(1.0 / args.physics_hz, physicsClientId=client_id)
+        if args.solver_iters is not None:
+            p.setPhysicsEngineParameter(numSolverIterations=max(1, args.solver_iters), physicsClientId=client_id)
         p.loadURDF("plane.urdf", physicsClientId=client_id)
         car_id = p.loadURDF("racecar/racecar.urdf", [0.0, 0.0, 0.20], physicsClientId=client_id)
         if not args.headless and args.follow_camera:
@@ -921,7 +1105,9 @@ def main() -> int:
                 ((6.0, -0.3), (0.30, 0.45)),
             ]
             obstacles = [make_box_obstacle(client_id, center, half) for center, half in obstacle_specs]
-        obstacle_body_ids = {obs.body_id for obs in obstacles}
+        obstacle_body_ids = frozenset(obs.body_id for obs in obstacles)
+        if not args.headless:
+            p.configureDebugVisualizer(p.COV_ENABLE_RENDERING, 1, physicsClientId=client_id)
 
         if args.mode != "manual":
             bridge = import_bridge_module(repo_root)
@@ -941,6 +1127,7 @@ def main() -> int:
                 drive_force=args.drive_force,
                 tick_hz=args.tick_hz,
                 draw_debug_enabled=not args.headless,
+                poll_keyboard=not args.headless,
                 follow_camera=bool((not args.headless) and args.follow_camera),
                 camera_distance=args.camera_distance,
                 camera_yaw=args.camera_yaw,
@@ -984,17 +1171,27 @@ def main() -> int:
                 "log_path": str(log_path),
                 "metadata_path": str(metadata_path),
             }
-            print(json.dumps(summary, indent=2))
-            return 0
+            return summary
 
-        ray_angles = [-45.0, -25.0, -10.0, 0.0, 10.0, 25.0, 45.0]
-        ray_length = 3.0
+        ray_angles = RAY_ANGLES_DEG
+        ray_length = RAY_LENGTH
 
         current_action = Action(steering=0.0, throttle=0.0)
         manual_steering_slider_id: Optional[int] = None
         manual_throttle_slider_id: Optional[int] = None
         manual_key_state = {"forward": False, "backward": False, "left": False, "right": False, "brake": False}
         manual_input_debug_id = -1
+        # Last overlay draw; the text is only re-sent when it changes, the car moves,
+        # or it is about to expire. PyBullet expires lifeTime (0.5 s) in wall-clock time,
+        # so the refresh is every 0.25 s of wall time, not sim time.
+        prev_status_text: Optional[str] = None
+        status_text = ""
+        status_key: Optional[Tuple[object, ...]] = None
+        prev_status_x = 0.0
+        prev_status_y = 0.0
+        prev_status_wall_ns = 0
+        # Reused for every overlay draw; PyBullet copies the values on the C side.
+        status_pos = [0.0, 0.0, 0.75]
         manual_keyboard_backend = "pybullet"
         manual_pynput: Optional[PynputKeyboardProvider] = None
         if args.mode == "manual" and not args.headless:
@@ -1040,115 +1237,199 @@ def main() -> int:
         manual_action_scale = max(0.1, float(args.manual_action_scale))
         max_steps = int(args.duration_sec * args.physics_hz * realtime_speed)
 
+        # Run-invariant settings, bound once so the step loop only touches locals.
+        show_gui = not args.headless
+        follow_camera = show_gui and args.follow_camera
+        # The keyboard backend and sliders are fixed once setup is done.
+        pynput_active = manual_keyboard_backend == "pynput" and manual_pynput is not None and manual_pynput.available
+        has_sliders = manual_steering_slider_id is not None and manual_throttle_slider_id is not None
+        physics_hz = args.physics_hz
+        mode = args.mode
+        pace = not args.no_sleep
+        sleep_dt_ns = int(round(1e9 / (physics_hz * realtime_speed)))
+        max_speed = args.max_speed * manual_action_scale
+        drive_force = args.drive_force * manual_action_scale
+        steering_force = args.steering_force
+        camera_distance = args.camera_distance
+        camera_yaw = args.camera_yaw
+        camera_pitch = args.camera_pitch
+        camera_target_z = args.camera_target_z
+        goal_x, goal_y = goal_xy
+        input_poll_every = max(1, int(round(args.tick_hz / 60.0)))
+        camera_every = max(1, int(round(args.tick_hz / 30.0)))
+        # Per-tick records copy this template (fixed key order, constant fields
+        # pre-filled) and assign only the fields that change.
+        record_base: Dict[str, object] = {
+            "schema_version": SCHEMA_VERSION,
+            "run_id": run_id,
+            "tick_index": None,
+            "sim_time_s": None,
+            "wall_time_s": None,
+            "mode": mode,
+            "state": None,
+            "goal": {"x": goal_x, "y": goal_y},
+            "distance_to_goal": None,
+            "collision_imminent": None,
+            "action": None,
+            "collisions_total": None,
+            "goal_reached": None,
+        }
+
         tick_index = 0
         collision_count = 0
         success_tick: Optional[int] = None
-        wall_start = time.perf_counter()
+        wall_start_ns = time.perf_counter_ns()
+        # Absolute-deadline pacing: sleep only the residual to the next step so
+        # late wake-ups do not accumulate as drift.
+        deadline_ns = wall_start_ns
+        steps_to_next_tick = 0
+        ticks_to_next_input_poll = 0
+        ticks_to_next_camera = 0
+        applied_action: Optional[Action] = None
 
         for step_idx in range(max_steps):
             p.stepSimulation(physicsClientId=client_id)
 
-            if step_idx % tick_every_n == 0:
+            if steps_to_next_tick == 0:
+                steps_to_next_tick = tick_every_n
                 tick_index += 1
-                sim_time_s = step_idx / args.physics_hz
+                sim_time_s = step_idx / physics_hz
                 state = car_state(client_id, car_id)
-                distance_to_goal = math.hypot(goal_xy[0] - state.x, goal_xy[1] - state.y)
+                goal_dx = goal_x - state.x
+                goal_dy = goal_y - state.y
+                distance_to_goal = math.sqrt(goal_dx * goal_dx + goal_dy * goal_dy)
 
                 ray_distances, ray_segments = raycast_observation(client_id, state, ray_angles, ray_length)
                 collision_imminent = min(ray_distances) < 0.9
 
-                key_events: Dict[int, int] = {}
-                if manual_keyboard_backend == "pynput" and manual_pynput is not None and manual_pynput.available:
-                    snapshot = manual_pynput.snapshot()
-                    manual_key_state = {
-                        "forward": bool(snapshot.get("forward", False)),
-                        "backward": bool(snapshot.get("backward", False)),
-                        "left": bool(snapshot.get("left", False)),
-                        "right": bool(snapshot.get("right", False)),
-                        "brake": bool(snapshot.get("brake", False)),
-                    }
-                    keyboard_control = action_from_key_state(snapshot)
-                else:
-                    keyboard_control, manual_key_state, key_events = poll_pybullet_key_state(client_id, manual_key_state)
-
-                keyboard_active = any(manual_key_state.values())
-                if keyboard_active:
-                    current_action = keyboard_control
-                    control_source = "keyboard"
-                elif manual_steering_slider_id is not None and manual_throttle_slider_id is not None:
-                    current_action = Action(
-                        steering=p.readUserDebugParameter(manual_steering_slider_id, physicsClientId=client_id),
-                        throttle=p.readUserDebugParameter(manual_throttle_slider_id, physicsClientId=client_id),
-                    )
-                    control_source = "slider"
-                else:
-                    current_action = keyboard_control
-                    control_source = "keyboard"
-
-                if not args.headless:
-                    status_text = (
-                        f"control={control_source} backend={manual_keyboard_backend}  "
-                        f"keys[f={int(manual_key_state['forward'])},b={int(manual_key_state['backward'])},"
-                        f"l={int(manual_key_state['left'])},r={int(manual_key_state['right'])},"
-                        f"br={int(manual_key_state['brake'])}]  "
-                        f"events={len(key_events)}  "
-                        f"throttle={current_action.throttle:+.2f} steer={current_action.steering:+.2f}"
-                    )
-                    manual_input_debug_id = p.addUserDebugText(
-                        status_text,
-                        [state.x - 0.6, state.y + 0.7, 0.75],
-                        textColorRGB=[0.95, 0.95, 0.95],
-                        textSize=1.2,
-                        lifeTime=0.12,
-                        replaceItemUniqueId=manual_input_debug_id,
-                        physicsClientId=client_id,
+                # Human input changes at human rates; poll keyboard and sliders at
+                # roughly 60 Hz and keep the last control decision in between.
+                if ticks_to_next_input_poll == 0:
+                    ticks_to_next_input_poll = input_poll_every
+                    key_events: Dict[int, int] = {}
+                    if pynput_active:
+                        snapshot = manual_pynput.snapshot()
+                        manual_key_state["forward"] = bool(snapshot.get("forward", False))
+                        manual_key_state["backward"] = bool(snapshot.get("backward", False))
+                        manual_key_state["left"] = bool(snapshot.get("left", False))
+                        manual_key_state["right"] = bool(snapshot.get("right", False))
+                        manual_key_state["brake"] = bool(snapshot.get("brake", False))
+                        keyboard_control = action_from_key_state(snapshot)
+                    else:
+                        keyboard_control, manual_key_state, key_events = poll_pybullet_key_state(client_id, manual_key_state)
+
+                    keyboard_active = any(manual_key_state.values())
+                    if keyboard_active:
+                        current_action = keyboard_control
+                        control_source = "keyboard"
+                    elif has_sliders:
+                        current_action = Action(
+                            steering=p.readUserDebugParameter(manual_steering_slider_id, physicsClientId=client_id),
+                            throttle=p.readUserDebugParameter(manual_throttle_slider_id, physicsClientId=client_id),
+                        )
+                        control_source = "slider"
+                    else:
+                        current_action = keyboard_control
+                        control_source = "keyboard"
+                ticks_to_next_input_poll -= 1
+
+                if show_gui:
+                    next_status_key = (
+                        control_source,
+                        manual_key_state["forward"],
+                        manual_key_state["backward"],
+                        manual_key_state["left"],
+                        manual_key_state["right"],
+                        manual_key_state["brake"],
+                        len(key_events),
+                        current_action.throttle,
+                        current_action.steering,
                     )
-                if not args.headless and args.follow_camera:
-                    update_follow_camera(
+                    if next_status_key != status_key:
+                        status_key = next_status_key
+                        status_text = (
+                            f"control={control_source} backend={manual_keyboard_backend}  "
+                            f"keys[f={int(manual_key_state['forward'])},b={int(manual_key_state['backward'])},"
+                            f"l={int(manual_key_state['left'])},r={int(manual_key_state['right'])},"
+                            f"br={int(manual_key_state['brake'])}]  "
+                            f"events={len(key_events)}  "
+                            f"throttle={current_action.throttle:+.2f} steer={current_action.steering:+.2f}"
+                        )
+                    now_ns = time.perf_counter_ns()
+                    if (
+                        status_text != prev_status_text
+                        or abs(state.x - prev_status_x) > 0.02
+                        or abs(state.y - prev_status_y) > 0.02
+                        or now_ns - prev_status_wall_ns >= 250_000_000
+                    ):
+                        status_pos[0] = state.x - 0.6
+                        status_pos[1] = state.y + 0.7
+                        manual_input_debug_id = p.addUserDebugText(
+                            status_text,
+                            status_pos,
+                            textColorRGB=STATUS_TEXT_COLOR,
+                            textSize=1.2,
+                            lifeTime=0.5,
+                            replaceItemUniqueId=manual_input_debug_id,
+                            physicsClientId=client_id,
+                        )
+                        prev_status_text = status_text
+                        prev_status_x = state.x
+                        prev_status_y = state.y
+                        prev_status_wall_ns = now_ns
+                if follow_camera:
+                    if ticks_to_next_camera == 0:
+                        ticks_to_next_camera = camera_every
+                        update_follow_camera(
+                            client_id,
+                            state,
+                            distance=camera_distance,
+                            yaw=camera_yaw,
+                            pitch=camera_pitch,
+                            target_z=camera_target_z,
+                        )
+                    ticks_to_next_camera -= 1
+
+                # Motor targets persist in PyBullet, so only resend them when the action changes.
+                if current_action != applied_action:
+                    apply_action(
                         client_id,
-                        state,
-                        distance=args.camera_distance,
-                        yaw=args.camera_yaw,
-                        pitch=args.camera_pitch,
-                        target_z=args.camera_target_z,
+                        car_id,
+                        current_action,
+                        max_speed=max_speed,
+                        steering_force=steering_force,
+                        drive_force=drive_force,
                     )
-
-                apply_action(
-                    client_id,
-                    car_id,
-                    current_action,
-                    max_speed=args.max_speed * manual_action_scale,
-                    steering_force=args.steering_force,
-                    drive_force=args.drive_force * manual_action_scale,
-                )
+                    applied_action = current_action
 
                 contacts = p.getContactPoints(bodyA=car_id, physicsClientId=client_id)
-                if any(cp[2] in obstacle_body_ids for cp in contacts):
+                if not obstacle_body_ids.isdisjoint(map(_contact_body_b, contacts)):
                     collision_count += 1
 
                 if success_tick is None and distance_to_goal < 0.6:
                     success_tick = tick_index
 
-                record = {
-                    "schema_version": SCHEMA_VERSION,
-                    "run_id": run_id,
-                    "tick_index": tick_index,
-                    "sim_time_s": sim_time_s,
-                    "wall_time_s": time.perf_counter() - wall_start,
-                    "mode": args.mode,
-                    "state": dataclasses.asdict(state),
-                    "goal": {"x": goal_xy[0], "y": goal_xy[1]},
-                    "distance_to_goal": distance_to_goal,
-                    "collision_imminent": collision_imminent,
-                    "action": {"steering": current_action.steering, "throttle": current_action.throttle},
-                    "collisions_total": collision_count,
-                    "goal_reached": bool(success_tick is not None),
-                }
-                validate_log_record_v1(record)
+                record = record_base.copy()
+                record["tick_index"] = tick_index
+                record["sim_time_s"] = sim_time_s
+                record["wall_time_s"] = (time.perf_counter_ns() - wall_start_ns) * 1e-9
+                record["state"] = _state_dict(state)
+                record["distance_to_goal"] = distance_to_goal
+                record["collision_imminent"] = collision_imminent
+                record["action"] = {"steering": current_action.steering, "throttle": current_action.throttle}
+                record["collisions_total"] = collision_count
+                record["goal_reached"] = success_tick is not None
                 sink.write(record)
+            steps_to_next_tick -= 1
 
-            if not args.no_sleep:
-                time.sleep(1.0 / (args.physics_hz * realtime_speed))
+            if pace:
+                deadline_ns += sleep_dt_ns
+                remaining_ns = deadline_ns - time.perf_counter_ns()
+                if remaining_ns > MIN_PACING_SLEEP_NS:
+                    time.sleep(remaining_ns * 1e-9)
+                elif remaining_ns < -sleep_dt_ns:
+                    # Too far behind to catch up; resync instead of spinning through missed steps.
+                    deadline_ns = time.perf_counter_ns()
 
         summary = {
             "run_id": run_id,
@@ -1160,14 +1441,47 @@ def main() -> int:
             "log_path": str(log_path),
             "metadata_path": str(metadata_path),
         }
-        print(json.dumps(summary, indent=2))
-        return 0
+        return summary
+
+    except BaseException:
+        episode_failed = True
+        raise
 
     finally:
         if "manual_pynput" in locals() and manual_pynput is not None:
             manual_pynput.close()
-        sink.close()
-        p.disconnect(physicsClientId=client_id)
+        try:
+            sink.close()
+        except Exception:
+            # Keep the episode's own exception as the one that propagates.
+            if not episode_failed:
+                raise
+        finally:
+            p.disconnect(physicsClientId=client_id)
+
+
+def worker_args(args: argparse.Namespace, worker_id: int) -> argparse.Namespace:
+    worker = argparse.Namespace(**vars(args))
+    worker.seed = args.seed + worker_id
+    worker.num_envs = 1
+    if args.log_path is not None:
+        worker.log_path = args.log_path.with_name(f"{args.log_path.stem}_env{worker_id}{args.log_path.suffix}")
+    return worker
+
+
+def main() -> int:
+    args = parse_args()
+    if args.num_envs <= 1:
+        print(_json_dumps_indent(run_episode(args)))
+        return 0
+
+    if not args.headless:
+        raise SystemExit("--num-envs > 1 requires --headless (one DIRECT client per worker process).")
+    # Bullet client state does not survive fork, so each worker starts from a fresh interpreter.
+    with multiprocessing.get_context("spawn").Pool(args.num_envs) as pool:
+        summaries = pool.map(run_episode, [worker_args(args, worker_id) for worker_id in range(args.num_envs)])
+    print(_json_dumps_indent(summaries))
+    return 0
 
 
 if __name__ == "__main__":
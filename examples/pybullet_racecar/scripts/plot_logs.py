@@ -3,7 +3,7 @@ from __future__ import annotations
 
 import argparse
 import json
-from collections import defaultdict
+from collections import Counter
 from pathlib import Path
 from typing import Dict, List
 
@@ -12,16 +12,17 @@ import matplotlib.pyplot as plt
 
 def load_jsonl(path: Path) -> List[Dict[str, object]]:
     rows: List[Dict[str, object]] = []
-    for raw in path.read_text(encoding="utf-8").splitlines():
-        line = raw.strip()
-        if not line:
-            continue
-        rows.append(json.loads(line))
+    # Stream line by line so the raw text of a long log is never held alongside the parsed rows.
+    with path.open("r", encoding="utf-8") as handle:
+        for raw in handle:
+            line = raw.strip()
+            if not line:
+                continue
+            rows.append(json.loads(line))
     return rows
 
 
-def save_budget_adherence(rows: List[Dict[str, object]], out_dir: Path) -> None:
-    planner_rows = [row for row in rows if isinstance(row.get("planner"), dict)]
+def save_budget_adherence(planner_rows: List[Dict[str, object]], out_dir: Path) -> None:
     if not planner_rows:
         return
 
@@ -50,8 +51,7 @@ def save_budget_adherence(rows: List[Dict[str, object]], out_dir: Path) -> None:
     plt.close(fig)
 
 
-def save_planner_growth(rows: List[Dict[str, object]], out_dir: Path) -> None:
-    planner_rows = [row for row in rows if isinstance(row.get("planner"), dict)]
+def save_planner_growth(planner_rows: List[Dict[str, object]], out_dir: Path) -> None:
     if not planner_rows:
         return
 
@@ -80,8 +80,7 @@ def save_planner_growth(rows: List[Dict[str, object]], out_dir: Path) -> None:
     plt.close(fig)
 
 
-def save_confidence(rows: List[Dict[str, object]], out_dir: Path) -> None:
-    planner_rows = [row for row in rows if isinstance(row.get("planner"), dict)]
+def save_confidence(planner_rows: List[Dict[str, object]], out_dir: Path) -> None:
     if not planner_rows:
         return
 
@@ -120,9 +119,8 @@ def save_action_trace(rows: List[Dict[str, object]], out_dir: Path) -> None:
     plt.close(fig)
 
 
-def save_top_k_distribution(rows: List[Dict[str, object]], out_dir: Path) -> None:
-    planner_rows = [row for row in rows if isinstance(row.get("planner"), dict)]
-    totals: Dict[str, int] = defaultdict(int)
+def save_top_k_distribution(planner_rows: List[Dict[str, object]], out_dir: Path) -> None:
+    totals: Counter[str] = Counter()
     for row in planner_rows:
         planner = row["planner"]  # type: ignore[assignment]
         top_k = planner.get("top_k", [])  # type: ignore[union-attr]
@@ -142,7 +140,7 @@ def save_top_k_distribution(rows: List[Dict[str, object]], out_dir: Path) -> Non
     if not totals:
         return
 
-    top_items = sorted(totals.items(), key=lambda item: item[1], reverse=True)[:12]
+    top_items = totals.most_common(12)
     labels = [item[0] for item in top_items]
     visits = [item[1] for item in top_items]
 
@@ -171,11 +169,13 @@ def main() -> int:
         raise RuntimeError(f"No rows found in {args.log_jsonl}")
     args.out.mkdir(parents=True, exist_ok=True)
 
-    save_budget_adherence(rows, args.out)
-    save_planner_growth(rows, args.out)
-    save_confidence(rows, args.out)
+    # Filter planner ticks once; every planner plot reads the same subset.
+    planner_rows = [row for row in rows if isinstance(row.get("planner"), dict)]
+    save_budget_adherence(planner_rows, args.out)
+    save_planner_growth(planner_rows, args.out)
+    save_confidence(planner_rows, args.out)
     save_action_trace(rows, args.out)
-    save_top_k_distribution(rows, args.out)
+    save_top_k_distribution(planner_rows, args.out)
     print(f"Saved plots to: {args.out}")
     return 0
 
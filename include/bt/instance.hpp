@@ -78,7 +78,7 @@ struct instance {
     bool read_trace_enabled = false;
 
     tree_profile_stats tree_stats{};
-    std::unordered_map<node_id, node_profile_stats> node_stats;
+    std::vector<node_profile_stats> node_stats;  // indexed by node_id; unticked nodes have an empty name
     std::vector<node_id> halt_stack;
 
     trace_buffer trace;
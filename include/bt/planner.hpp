@@ -80,6 +80,8 @@ struct planner_mcts_config {
     std::string action_sampler = "model_default";
     std::int64_t default_iters = 2000;
     std::int64_t time_check_interval = 8;
+    std::int64_t root_parallel = 1;
+    std::int64_t root_merge_bins = 8;
 };
 
 struct planner_mppi_config {
@@ -160,6 +162,10 @@ public:
 
     [[nodiscard]] virtual bool quadraticise_terminal_cost(const planner_vector& state,
                                                           planner_terminal_quadratic_cost& out) const;
+
+    // True when the model may be called from several threads at once. MCTS root_parallel only
+    // searches its trees concurrently for such models; others run the trees one after another.
+    [[nodiscard]] virtual bool thread_safe() const;
 };
 
 enum class planner_status {
@@ -297,6 +303,8 @@ public:
     [[nodiscard]] std::uint64_t derive_seed(std::string_view node_name, std::uint64_t tick_index) const;
 
     [[nodiscard]] static std::uint64_t hash64(std::string_view text) noexcept;
+    // Seed used by root-parallel MCTS tree `tree` for a request seeded with `seed`.
+    [[nodiscard]] static std::uint64_t mcts_tree_seed(std::uint64_t seed, std::int64_t tree) noexcept;
 
     void set_jsonl_path(std::string path);
     [[nodiscard]] const std::string& jsonl_path() const noexcept;
@@ -40,13 +40,11 @@ double clamp_double(double value, double lo, double hi) {
 double wrap_angle(double angle) {
     constexpr double kPi = 3.14159265358979323846;
     constexpr double kTwoPi = 6.28318530717958647692;
-    while (angle > kPi) {
-        angle -= kTwoPi;
+    if (angle >= -kPi && angle <= kPi) {
+        return angle;
     }
-    while (angle < -kPi) {
-        angle += kTwoPi;
-    }
-    return angle;
+    // One exact reduction regardless of how many turns out the angle is.
+    return std::remainder(angle, kTwoPi);
 }
 
 double finite_or_throw(double value, const std::string& where) {
@@ -260,7 +258,8 @@ public:
 
         const double accel = (4.0 * throttle) - (1.25 * speed);
         const double speed2 = clamp_double(speed + accel * kDt, 0.0, kMaxSpeed);
-        const double yaw_rate = (std::fabs(kWheelBase) > 1.0e-6)
+        // A stopped or straight-steered car has zero yaw rate; skip the tan in that case.
+        const double yaw_rate = (std::fabs(kWheelBase) > 1.0e-6 && speed2 != 0.0 && steering != 0.0)
                                     ? ((speed2 / kWheelBase) * std::tan(steering * kMaxSteerRad))
                                     : 0.0;
         const double yaw2 = wrap_angle(yaw + yaw_rate * kDt);
@@ -271,23 +270,13 @@ public:
         const double dy_before = gy - y;
         const double dx_after = gx - x2;
         const double dy_after = gy - y2;
-        const double dist_before = std::hypot(dx_before, dy_before);
-        const double dist_after = std::hypot(dx_after, dy_after);
+        // Plain sqrt: positions are metres-scale, so hypot's overflow/underflow guarding buys nothing here.
+        const double dist_before = std::sqrt((dx_before * dx_before) + (dy_before * dy_before));
+        const double dist_after = std::sqrt((dx_after * dx_after) + (dy_after * dy_after));
         const double progress_reward = dist_before - dist_after;
         const double control_penalty = 0.02 * ((steering * steering) + (throttle * throttle));
 
-        double min_ray = 3.0;
-        if (state.size() > 6) {
-            min_ray = *std::min_element(state.begin() + 6, state.end());
-        }
-        const bool hard_collision = min_ray < 0.25;
-        const bool imminent_collision = min_ray < 0.90;
-        const double collision_penalty = hard_collision ? 2.5 : (imminent_collision ? 0.4 : 0.0);
-        const double goal_bonus = (dist_after < 0.60) ? 1.5 : 0.0;
-
         planner_step_result out;
-        out.reward = progress_reward - control_penalty - collision_penalty + goal_bonus;
-        out.done = hard_collision || (dist_after < 0.60);
         out.next_state.reserve(state.size());
         out.next_state.push_back(x2);
         out.next_state.push_back(y2);
@@ -296,12 +285,27 @@ public:
         out.next_state.push_back(gx);
         out.next_state.push_back(gy);
 
+        // One pass over the rays: track the clearance for the collision check and
+        // propagate the decayed distances into the next state.
+        double min_ray = 3.0;
         if (state.size() > 6) {
             const double ray_decay = std::max(0.0, speed2) * kDt;
+            min_ray = state[6];
             for (std::size_t i = 6; i < state.size(); ++i) {
-                out.next_state.push_back(clamp_double(state[i] - ray_decay, 0.0, 10.0));
+                const double ray = state[i];
+                if (ray < min_ray) {
+                    min_ray = ray;
+                }
+                out.next_state.push_back(clamp_double(ray - ray_decay, 0.0, 10.0));
             }
         }
+        const bool hard_collision = min_ray < 0.25;
+        const bool imminent_collision = min_ray < 0.90;
+        const double collision_penalty = hard_collision ? 2.5 : (imminent_collision ? 0.4 : 0.0);
+        const double goal_bonus = (dist_after < 0.60) ? 1.5 : 0.0;
+
+        out.reward = progress_reward - control_penalty - collision_penalty + goal_bonus;
+        out.done = hard_collision || (dist_after < 0.60);
         return out;
     }
 
@@ -342,6 +346,10 @@ public:
     std::size_t action_dims() const override {
         return 2;
     }
+
+    bool thread_safe() const override {
+        return true;
+    }
 };
 
 class flagship_shared_goal_planner_model final : public planner_model {
@@ -414,11 +422,17 @@ public:
     std::size_t action_dims() const override {
         return 2;
     }
+
+    bool thread_safe() const override {
+        return true;
+    }
 };
 
 void write_state_to_blackboard(instance& inst,
                                const racecar_state& state,
                                const racecar_loop_options& options,
+                               double goal_dist,
+                               bool goal_reached,
                                std::uint64_t tick_index,
                                std::chrono::steady_clock::time_point now) {
     inst.bb.put(options.action_key, bb_value{std::monostate{}}, tick_index, now, 0, "env.run-loop");
@@ -436,10 +450,8 @@ void write_state_to_blackboard(instance& inst,
     inst.bb.put("collision_imminent", bb_value{state.collision_imminent}, tick_index, now, 0, "env.run-loop");
     inst.bb.put("collision_count", bb_value{state.collision_count}, tick_index, now, 0, "env.run-loop");
     inst.bb.put("t_ms", bb_value{state.t_ms}, tick_index, now, 0, "env.run-loop");
-    const double goal_dist = distance_to_goal(state);
     const double obstacle_front = obstacle_front_from_rays(state.rays);
     const double bearing = goal_bearing(state);
-    const bool goal_reached = std::isfinite(goal_dist) && goal_dist <= options.goal_tolerance;
     inst.bb.put("distance_to_goal", bb_value{goal_dist}, tick_index, now, 0, "env.run-loop");
     inst.bb.put("goal_dist", bb_value{goal_dist}, tick_index, now, 0, "env.run-loop");
     inst.bb.put("goal_bearing", bb_value{bearing}, tick_index, now, 0, "env.run-loop");
@@ -602,8 +614,11 @@ racecar_loop_result run_racecar_loop(runtime_host& host, std::int64_t instance_h
             have_last_state = true;
             collisions_total = std::max(collisions_total, state.collision_count);
 
+            const double dist = distance_to_goal(state);
+            const bool goal_reached = std::isfinite(dist) && dist <= options.goal_tolerance;
+
             const auto now = std::chrono::steady_clock::now();
-            write_state_to_blackboard(*inst, state, options, inst->tick_index + 1, now);
+            write_state_to_blackboard(*inst, state, options, dist, goal_reached, inst->tick_index + 1, now);
 
             const status bt_status = host.tick_instance(instance_handle);
             const bb_entry* action_entry = inst->bb.get(options.action_key);
@@ -631,8 +646,6 @@ racecar_loop_result run_racecar_loop(runtime_host& host, std::int64_t instance_h
             }
 
             ++ticks;
-            const double dist = distance_to_goal(state);
-            const bool goal_reached = std::isfinite(dist) && dist <= options.goal_tolerance;
 
             tick_record.state = state;
             tick_record.sim_time_s = static_cast<double>(state.t_ms) / 1000.0;
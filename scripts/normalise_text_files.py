@@ -17,11 +17,14 @@ Usage:
 from __future__ import annotations
 
 import argparse
+import os
+import stat
 import subprocess
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
 
-TEXT_EXTS = {
+TEXT_EXTS = frozenset({
     ".c", ".cc", ".cpp", ".h", ".hpp", ".hh", ".inl",
     ".py", ".md",
     ".yml", ".yaml", ".json", ".toml",
@@ -29,16 +32,17 @@ TEXT_EXTS = {
     ".sh", ".bash", ".zsh",
     ".lisp", ".scm", ".clj",
     ".ini", ".cfg",
-}
+})
+EXTENSIONLESS_TEXT_NAMES = frozenset({"CMakeLists.txt", "LICENSE"})
 
 
-def git_tracked_files(repo_root: Path) -> list[Path]:
+def git_tracked_files(repo_root: Path) -> list[str]:
+    # -z keeps names verbatim (no quoting of unusual characters) and lets us split once on NUL.
     out = subprocess.check_output(
-        ["git", "ls-files"],
+        ["git", "ls-files", "-z"],
         cwd=str(repo_root),
-        text=True,
     )
-    return [repo_root / line.strip() for line in out.splitlines() if line.strip()]
+    return [os.fsdecode(name) for name in out.split(b"\0") if name]
 
 
 def looks_binary(data: bytes) -> bool:
@@ -46,37 +50,66 @@ def looks_binary(data: bytes) -> bool:
     return b"\x00" in data
 
 
-def should_consider(path: Path) -> bool:
-    if path.is_symlink() or not path.is_file():
-        return False
-    if path.suffix.lower() in TEXT_EXTS:
+def has_text_name(name: str) -> bool:
+    if os.path.splitext(name)[1].lower() in TEXT_EXTS:
         return True
     # Also catch common root files without extensions.
-    if path.name in {"CMakeLists.txt", "LICENSE"}:
-        return True
-    return False
+    return name in EXTENSIONLESS_TEXT_NAMES
+
+
+def is_regular_file(path: Path) -> bool:
+    # One lstat covers both "not a symlink" and "is a regular file".
+    try:
+        return stat.S_ISREG(os.lstat(path).st_mode)
+    except OSError:
+        return False
 
 
 def normalise_bytes(data: bytes) -> bytes:
-    # Decode as UTF-8. If this fails, leave the file alone.
+    # Validate as UTF-8. If this fails, leave the file alone.
     try:
-        s = data.decode("utf-8")
+        data.decode("utf-8")
     except UnicodeDecodeError:
         return data
 
+    # CR and LF never occur inside a multi-byte UTF-8 sequence, so the
+    # line-ending rewrite can run on the raw bytes without a decode/encode.
     # Normalise CRLF and CR to LF.
-    s2 = s.replace("\r\n", "\n").replace("\r", "\n")
+    out = data.replace(b"\r\n", b"\n").replace(b"\r", b"\n")
 
     # Ensure exactly one trailing newline.
-    s2 = s2.rstrip("\n") + "\n"
+    return out.rstrip(b"\n") + b"\n"
 
-    return s2.encode("utf-8")
+
+def process_one(p: Path) -> tuple[Path, str, bytes | None]:
+    """Classify one file as "binary", "decode", "changed" or "unchanged".
+
+    Returns the normalised bytes for "changed" files so the parent can write them.
+    """
+    data = p.read_bytes()
+
+    if looks_binary(data):
+        return p, "binary", None
+
+    new = normalise_bytes(data)
+    if new == data:
+        return p, "unchanged", None
+
+    # If we failed to decode, normalise_bytes returns original bytes.
+    # Distinguish that case so we do not rewrite unknown encodings.
+    try:
+        data.decode("utf-8")
+    except UnicodeDecodeError:
+        return p, "decode", None
+
+    return p, "changed", new
 
 
 def main() -> int:
     ap = argparse.ArgumentParser()
     ap.add_argument("--check", action="store_true", help="report files that would change")
     ap.add_argument("--apply", action="store_true", help="rewrite files in-place")
+    ap.add_argument("--jobs", type=int, default=None, help="worker processes (default: CPU count; 1 runs inline)")
     args = ap.parse_args()
 
     if args.check == args.apply:
@@ -88,32 +121,38 @@ def main() -> int:
     skipped_binary: list[Path] = []
     skipped_decode: list[Path] = []
 
-    for p in git_tracked_files(repo_root):
-        if not should_consider(p):
-            continue
-
-        data = p.read_bytes()
-
-        if looks_binary(data):
-            skipped_binary.append(p)
+    # Filter on the tracked name first; only text candidates become Paths and get stat-ed.
+    candidates: list[Path] = []
+    for rel in git_tracked_files(repo_root):
+        if not has_text_name(rel.rpartition("/")[2]):
             continue
+        p = repo_root / rel
+        if is_regular_file(p):
+            candidates.append(p)
+
+    # Files are independent, so classify them in worker processes; results come back
+    # in input order and all writes happen here in the parent.
+    if args.jobs == 1:
+        results = map(process_one, candidates)
+        executor = None
+    else:
+        executor = ProcessPoolExecutor(max_workers=args.jobs)
+        results = executor.map(process_one, candidates, chunksize=64)
 
-        new = normalise_bytes(data)
-        if new == data:
-            continue
-
-        # If we failed to decode, normalise_bytes returns original bytes.
-        # Distinguish that case so we do not rewrite unknown encodings.
-        try:
-            data.decode("utf-8")
-        except UnicodeDecodeError:
-            skipped_decode.append(p)
-            continue
-
-        changed.append(p)
-
-        if args.apply:
-            p.write_bytes(new)
+    try:
+        for p, kind, new in results:
+            if kind == "binary":
+                skipped_binary.append(p)
+            elif kind == "decode":
+                skipped_decode.append(p)
+            elif kind == "changed":
+                changed.append(p)
+                if args.apply:
+                    assert new is not None
+                    p.write_bytes(new)
+    finally:
+        if executor is not None:
+            executor.shutdown()
 
     if args.check:
         if changed:
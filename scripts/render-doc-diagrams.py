@@ -2,9 +2,11 @@
 from __future__ import annotations
 
 import argparse
+import os
 import shutil
 import subprocess
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 
@@ -23,6 +25,11 @@ def render_dot_to_svg(dot_path: Path, svg_path: Path) -> None:
     )
 
 
+def render_pair(paths: tuple[Path, Path]) -> tuple[Path, Path]:
+    render_dot_to_svg(*paths)
+    return paths
+
+
 def main() -> int:
     parser = argparse.ArgumentParser(description="Render docs DOT diagrams to SVG.")
     parser.add_argument("--force", action="store_true", help="Render all diagrams even if outputs look up-to-date.")
@@ -49,16 +56,19 @@ def main() -> int:
         print("warning: Graphviz 'dot' not found; using existing generated SVGs.")
         return 0
 
-    rendered = 0
+    to_render: list[tuple[Path, Path]] = []
     for dot_path in dot_files:
         svg_path = OUT_DIR / f"{dot_path.stem}.svg"
         if not args.force and svg_path.exists() and svg_path.stat().st_mtime >= dot_path.stat().st_mtime:
             continue
-        render_dot_to_svg(dot_path, svg_path)
-        rendered += 1
-        print(f"rendered: {dot_path} -> {svg_path}")
+        to_render.append((dot_path, svg_path))
+
+    # Each dot run is an independent subprocess, so a thread pool keeps several going at once.
+    with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+        for dot_path, svg_path in executor.map(render_pair, to_render):
+            print(f"rendered: {dot_path} -> {svg_path}")
 
-    if rendered == 0:
+    if not to_render:
         print("diagrams up to date")
     return 0
 
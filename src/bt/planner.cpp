@@ -4,13 +4,19 @@
 #include <array>
 #include <cmath>
 #include <cctype>
+#include <condition_variable>
+#include <deque>
+#include <exception>
 #include <filesystem>
 #include <fstream>
 #include <functional>
 #include <limits>
+#include <map>
+#include <mutex>
 #include <optional>
 #include <sstream>
 #include <stdexcept>
+#include <thread>
 #include <utility>
 
 namespace bt {
@@ -137,13 +143,11 @@ std::int64_t elapsed_ms(std::chrono::steady_clock::time_point start, std::chrono
 }
 
 double wrap_angle(double angle) {
-    while (angle > kPi) {
-        angle -= (2.0 * kPi);
+    if (angle >= -kPi && angle <= kPi) {
+        return angle;
     }
-    while (angle < -kPi) {
-        angle += (2.0 * kPi);
-    }
-    return angle;
+    // One exact reduction regardless of how many turns out the angle is.
+    return std::remainder(angle, 2.0 * kPi);
 }
 
 planner_vector clamp_action_with_bounds(const planner_vector& action,
@@ -556,6 +560,10 @@ public:
         out.l_xx = {2.0};
         return true;
     }
+
+    bool thread_safe() const override {
+        return true;
+    }
 };
 
 class ptz_track_model final : public planner_model {
@@ -636,6 +644,10 @@ public:
     std::int64_t default_horizon() const override {
         return 15;
     }
+
+    bool thread_safe() const override {
+        return true;
+    }
 };
 
 class toy_unicycle_goal_model final : public planner_model {
@@ -726,6 +738,10 @@ public:
         out = step(state, action, rng);
         return true;
     }
+
+    bool thread_safe() const override {
+        return true;
+    }
 };
 
 class flagship_shared_goal_planner_model final : public planner_model {
@@ -798,15 +814,19 @@ public:
     std::size_t action_dims() const override {
         return 2;
     }
+
+    bool thread_safe() const override {
+        return true;
+    }
 };
 
-struct mcts_node;
+inline constexpr std::size_t k_mcts_no_node = static_cast<std::size_t>(-1);
 
 struct mcts_child {
     planner_vector action;
     std::int64_t visits = 0;
     double value_sum = 0.0;
-    std::unique_ptr<mcts_node> next;
+    std::size_t next = k_mcts_no_node;  // index into the search's node arena
 };
 
 struct mcts_node {
@@ -822,24 +842,34 @@ struct mcts_node {
     }
 };
 
-double ucb_score(const mcts_child& child, std::int64_t parent_visits, double c_ucb) {
+// Node slots recycled across searches on the same thread. A search takes ownership of the
+// pool while it runs, so a nested search simply starts from an empty arena.
+thread_local std::vector<mcts_node> t_mcts_node_pool;
+constexpr std::size_t k_mcts_pool_max_nodes = std::size_t{1} << 16;
+constexpr std::int64_t k_mcts_max_root_parallel = 64;
+
+double ucb_score(const mcts_child& child, double log_parent_n, double c_ucb) {
     if (child.visits <= 0) {
         return 1.0e30;
     }
     const double q = child.value_sum / static_cast<double>(child.visits);
-    const double parent_n = static_cast<double>(std::max<std::int64_t>(1, parent_visits));
     const double child_n = static_cast<double>(child.visits);
-    return q + c_ucb * std::sqrt(std::log(parent_n) / child_n);
+    return q + c_ucb * std::sqrt(log_parent_n / child_n);
 }
 
 std::optional<std::size_t> select_child_index(const mcts_node& node, double c_ucb) {
     if (node.children.empty()) {
         return std::nullopt;
     }
+    // The parent term is shared by every child; take its log once per selection.
+    const double log_parent_n = std::log(static_cast<double>(std::max<std::int64_t>(1, node.visits)));
     std::size_t best_idx = 0;
     double best_score = -1.0e300;
     for (std::size_t i = 0; i < node.children.size(); ++i) {
-        const double score = ucb_score(node.children[i], node.visits, c_ucb);
+        if (node.children[i].visits <= 0) {
+            return i;  // unvisited children score above any visited one; the first wins ties
+        }
+        const double score = ucb_score(node.children[i], log_parent_n, c_ucb);
         if (score > best_score) {
             best_score = score;
             best_idx = i;
@@ -848,160 +878,433 @@ std::optional<std::size_t> select_child_index(const mcts_node& node, double c_uc
     return best_idx;
 }
 
-planner_result run_mcts_backend(const planner_request& request,
-                                const planner_model& model,
-                                const std::vector<planner_bound>& bounds,
-                                const planner_action& safe_action,
-                                const std::string& action_schema,
-                                std::chrono::steady_clock::time_point deadline) {
-    planner_result result;
-    result.planner = planner_backend::mcts;
-    result.action = safe_action;
-
-    planner_mcts_config cfg = request.mcts;
-    cfg.gamma = clamp_double(cfg.gamma, 0.0, 1.0);
-    cfg.c_ucb = std::max(0.0, cfg.c_ucb);
-    cfg.pw_k = std::max(0.0, cfg.pw_k);
-    cfg.pw_alpha = std::max(0.0, cfg.pw_alpha);
-    cfg.max_depth = std::max<std::int64_t>(1, cfg.max_depth);
-    cfg.time_check_interval = std::max<std::int64_t>(1, cfg.time_check_interval);
-
-    const std::int64_t iter_cap = std::max<std::int64_t>(
-        1,
-        request.work_max > 0 ? request.work_max : std::max<std::int64_t>(1, cfg.default_iters));
-
-    planner_rng rng(request.seed);
-
-    mcts_node root;
+struct mcts_tree_search {
+    std::vector<mcts_child> root_children;  // copied out so the arena can go back to its pool
+    std::int64_t root_visits = 0;
     std::int64_t widen_added = 0;
+    std::int64_t completed_iters = 0;
     bool timed_out = false;
+};
 
-    std::function<double(const planner_vector&, std::int64_t)> rollout = [&](const planner_vector& state,
-                                                                             std::int64_t depth) -> double {
-        if (depth >= cfg.max_depth) {
-            return 0.0;
-        }
-
-        planner_vector action;
-        if (normalized_token(cfg.rollout_policy) == "random") {
-            action = model.sample_action(state, rng);
+mcts_tree_search run_mcts_tree(const planner_request& request,
+                               const planner_model& model,
+                               const std::vector<planner_bound>& bounds,
+                               const planner_action& safe_action,
+                               const planner_mcts_config& cfg,
+                               std::int64_t iter_cap,
+                               std::uint64_t seed,
+                               std::chrono::steady_clock::time_point deadline) {
+    planner_rng rng(seed);
+
+    // Nodes live in one arena addressed by index rather than one heap allocation per node.
+    // A simulation adds at most one node, so the reservation usually covers the whole search.
+    // Slots below nodes.size() but at or above node_count are left over from an earlier
+    // search and are reset on reuse, keeping their children buffers' capacity.
+    std::vector<mcts_node> nodes = std::move(t_mcts_node_pool);
+    t_mcts_node_pool.clear();
+    nodes.reserve(std::min(static_cast<std::size_t>(iter_cap), k_mcts_pool_max_nodes) + 1);
+    std::size_t node_count = 0;
+    const auto acquire_node = [&]() -> std::size_t {
+        if (node_count < nodes.size()) {
+            mcts_node& slot = nodes[node_count];
+            slot.visits = 0;
+            slot.value_sum = 0.0;
+            slot.children.clear();
         } else {
-            action = model.rollout_action(state, rng);
+            nodes.emplace_back();
         }
-        action = clamp_action_with_bounds(action, bounds, model);
+        return node_count++;
+    };
+    const std::size_t root_index = acquire_node();
+    std::int64_t widen_added = 0;
+    bool timed_out = false;
 
-        const planner_step_result step_out = model.step(state, action, rng);
-        if (step_out.done) {
-            return step_out.reward;
+    // Rollout and tree descent are iterative: per-step rewards are kept in reusable buffers
+    // and discounted bottom-up afterwards, matching the recursive formulation exactly.
+    std::vector<double> rollout_rewards;
+    const bool random_rollout = normalized_token(cfg.rollout_policy) == "random";
+    const auto rollout = [&](planner_vector state, std::int64_t depth) -> double {
+        rollout_rewards.clear();
+        bool ended_done = false;
+        for (; depth < cfg.max_depth; ++depth) {
+            planner_vector action;
+            if (random_rollout) {
+                action = model.sample_action(state, rng);
+            } else {
+                action = model.rollout_action(state, rng);
+            }
+            action = clamp_action_with_bounds(action, bounds, model);
+
+            planner_step_result step_out = model.step(state, action, rng);
+            rollout_rewards.push_back(step_out.reward);
+            if (step_out.done) {
+                ended_done = true;
+                break;
+            }
+            state = std::move(step_out.next_state);
         }
-        return step_out.reward + cfg.gamma * rollout(step_out.next_state, depth + 1);
-    };
 
-    std::function<double(mcts_node&, const planner_vector&, std::int64_t)> simulate =
-        [&](mcts_node& node, const planner_vector& state, std::int64_t depth) -> double {
-        if (depth >= cfg.max_depth) {
-            return 0.0;
+        std::size_t remaining = rollout_rewards.size();
+        double value = 0.0;
+        if (ended_done) {
+            value = rollout_rewards[--remaining];
         }
+        while (remaining > 0) {
+            value = rollout_rewards[--remaining] + cfg.gamma * value;
+        }
+        return value;
+    };
 
-        const double child_cap =
-            cfg.pw_k * std::pow(static_cast<double>(std::max<std::int64_t>(1, node.visits)), cfg.pw_alpha);
-        const bool allow_expand = static_cast<double>(node.children.size()) < child_cap;
+    // Resolved once per search rather than per widening.
+    const bool widen_with_safe_action =
+        normalized_token(cfg.action_sampler) == "safe_action" && safe_action.u.size() == model.action_dims();
 
-        if (allow_expand) {
-            planner_vector sampled;
-            if (normalized_token(cfg.action_sampler) == "safe_action" && safe_action.u.size() == model.action_dims()) {
-                sampled = safe_action.u;
-            } else {
-                sampled = model.sample_action(state, rng);
-            }
+    struct mcts_path_step {
+        std::size_t node_index = 0;
+        std::size_t child_index = 0;
+        double reward = 0.0;
+        bool done = false;
+    };
+    std::vector<mcts_path_step> path;
+    planner_vector descent_state;
+
+    const auto simulate = [&]() {
+        path.clear();
+        const planner_vector* state = &request.state;
+        std::size_t node_index = root_index;
+        double value = 0.0;
+        for (std::int64_t depth = 0; depth < cfg.max_depth; ++depth) {
+            mcts_node& node = nodes[node_index];
+
+            const double child_cap =
+                cfg.pw_k * std::pow(static_cast<double>(std::max<std::int64_t>(1, node.visits)), cfg.pw_alpha);
+            const bool allow_expand = static_cast<double>(node.children.size()) < child_cap;
+
+            if (allow_expand) {
+                planner_vector sampled;
+                if (widen_with_safe_action) {
+                    sampled = safe_action.u;
+                } else {
+                    sampled = model.sample_action(*state, rng);
+                }
 
-            planner_vector action = clamp_action_with_bounds(sampled, bounds, model);
-            mcts_child child;
-            child.action = action;
+                planner_vector action = clamp_action_with_bounds(sampled, bounds, model);
+                mcts_child child;
+                child.action = action;
 
-            const planner_step_result step_out = model.step(state, action, rng);
-            double value = step_out.reward;
-            if (!step_out.done) {
-                value += cfg.gamma * rollout(step_out.next_state, depth + 1);
-            }
+                planner_step_result step_out = model.step(*state, action, rng);
+                value = step_out.reward;
+                if (!step_out.done) {
+                    value += cfg.gamma * rollout(std::move(step_out.next_state), depth + 1);
+                }
 
-            child.visits = 1;
-            child.value_sum = value;
-            node.children.push_back(std::move(child));
-            ++widen_added;
+                child.visits = 1;
+                child.value_sum = value;
+                node.children.push_back(std::move(child));
+                ++widen_added;
 
-            ++node.visits;
-            node.value_sum += value;
-            return value;
-        }
+                ++node.visits;
+                node.value_sum += value;
+                break;
+            }
 
-        const std::optional<std::size_t> choice = select_child_index(node, cfg.c_ucb);
-        if (!choice.has_value()) {
-            ++node.visits;
-            return 0.0;
-        }
+            const std::optional<std::size_t> choice = select_child_index(node, cfg.c_ucb);
+            if (!choice.has_value()) {
+                ++node.visits;
+                break;
+            }
 
-        mcts_child& child = node.children[*choice];
-        const planner_step_result step_out = model.step(state, child.action, rng);
+            const std::size_t child_index = *choice;
+            planner_step_result step_out = model.step(*state, node.children[child_index].action, rng);
+            path.push_back(mcts_path_step{node_index, child_index, step_out.reward, step_out.done});
+            if (step_out.done) {
+                break;
+            }
 
-        double value = step_out.reward;
-        if (!step_out.done) {
-            if (!child.next) {
-                child.next = std::make_unique<mcts_node>();
+            std::size_t next_index = node.children[child_index].next;
+            if (next_index == k_mcts_no_node) {
+                next_index = node_count;
+                node.children[child_index].next = next_index;
+                (void)acquire_node();  // may reallocate; `node` is not used past this point
             }
-            value += cfg.gamma * simulate(*child.next, step_out.next_state, depth + 1);
+            descent_state = std::move(step_out.next_state);
+            state = &descent_state;
+            node_index = next_index;
         }
 
-        ++child.visits;
-        child.value_sum += value;
-        ++node.visits;
-        node.value_sum += value;
-        return value;
+        // Back up along the selected path, deepest edge first.
+        for (auto it = path.rbegin(); it != path.rend(); ++it) {
+            value = it->done ? it->reward : it->reward + cfg.gamma * value;
+            mcts_node& parent = nodes[it->node_index];
+            mcts_child& child = parent.children[it->child_index];
+            ++child.visits;
+            child.value_sum += value;
+            ++parent.visits;
+            parent.value_sum += value;
+        }
     };
 
     std::int64_t completed_iters = 0;
+    std::int64_t iters_to_time_check = 0;
     for (std::int64_t i = 0; i < iter_cap; ++i) {
-        if ((i % cfg.time_check_interval) == 0) {
+        if (iters_to_time_check == 0) {
+            iters_to_time_check = cfg.time_check_interval;
             const auto now = std::chrono::steady_clock::now();
             if (now >= deadline) {
                 timed_out = true;
                 break;
             }
         }
-        (void)simulate(root, request.state, 0);
+        --iters_to_time_check;
+        simulate();
         ++completed_iters;
     }
 
-    std::vector<const mcts_child*> sorted_children;
-    sorted_children.reserve(root.children.size());
-    for (const mcts_child& child : root.children) {
-        sorted_children.push_back(&child);
+    mcts_tree_search search;
+    search.root_children = nodes[root_index].children;
+    search.root_visits = nodes[root_index].visits;
+    search.widen_added = widen_added;
+    search.completed_iters = completed_iters;
+    search.timed_out = timed_out;
+    // The arena goes back to this thread's pool (the caller's, or a persistent worker's).
+    if (nodes.size() <= k_mcts_pool_max_nodes) {
+        t_mcts_node_pool = std::move(nodes);
     }
-    std::sort(sorted_children.begin(), sorted_children.end(), [](const mcts_child* lhs, const mcts_child* rhs) {
-        return lhs->visits > rhs->visits;
-    });
+    return search;
+}
+
+// Set while a thread runs an mcts_worker_pool task, on pool workers and on the calling thread.
+thread_local bool t_mcts_pool_task = false;
+
+// Persistent threads for root-parallel MCTS so a planner call does not create and join
+// threads at tick rate. Workers start on first use, grow to the largest tree count seen
+// (at most k_mcts_max_root_parallel - 1) and live until process exit.
+class mcts_worker_pool {
+public:
+    static mcts_worker_pool& shared() {
+        static mcts_worker_pool pool;
+        return pool;
+    }
+
+    mcts_worker_pool(const mcts_worker_pool&) = delete;
+    mcts_worker_pool& operator=(const mcts_worker_pool&) = delete;
+
+    ~mcts_worker_pool() {
+        {
+            std::lock_guard<std::mutex> lock(mutex_);
+            stopping_ = true;
+        }
+        cv_.notify_all();
+        for (std::thread& worker : workers_) {
+            worker.join();
+        }
+    }
+
+    // Runs task(1) .. task(count - 1) on pool threads and task(0) on the caller, then waits for
+    // all of them. Tasks must not throw. A task that plans again (a model calling the planner,
+    // say) would queue jobs behind itself and wait on them, so nested runs execute serially on
+    // the calling thread.
+    void run(std::int64_t count, const std::function<void(std::int64_t)>& task) {
+        if (t_mcts_pool_task || count <= 1) {
+            for (std::int64_t k = 0; k < count; ++k) {
+                task(k);
+            }
+            return;
+        }
+        struct completion {
+            std::mutex mutex;
+            std::condition_variable cv;
+            std::int64_t pending = 0;
+        } done;
+        done.pending = count - 1;
+        {
+            std::lock_guard<std::mutex> lock(mutex_);
+            while (static_cast<std::int64_t>(workers_.size()) < count - 1) {
+                workers_.emplace_back([this]() { worker_loop(); });
+            }
+            for (std::int64_t k = 1; k < count; ++k) {
+                jobs_.emplace_back([&task, &done, k]() {
+                    task(k);
+                    std::lock_guard<std::mutex> done_lock(done.mutex);
+                    --done.pending;
+                    done.cv.notify_one();  // under the lock: `done` lives on the caller's stack
+                });
+            }
+        }
+        cv_.notify_all();
+        t_mcts_pool_task = true;
+        task(0);
+        t_mcts_pool_task = false;
+        std::unique_lock<std::mutex> lock(done.mutex);
+        done.cv.wait(lock, [&done]() { return done.pending == 0; });
+    }
+
+private:
+    mcts_worker_pool() = default;
+
+    void worker_loop() {
+        t_mcts_pool_task = true;
+        for (;;) {
+            std::function<void()> job;
+            {
+                std::unique_lock<std::mutex> lock(mutex_);
+                cv_.wait(lock, [this]() { return stopping_ || !jobs_.empty(); });
+                if (jobs_.empty()) {
+                    return;
+                }
+                job = std::move(jobs_.front());
+                jobs_.pop_front();
+            }
+            job();
+        }
+    }
+
+    std::mutex mutex_;
+    std::condition_variable cv_;
+    std::deque<std::function<void()>> jobs_;
+    std::vector<std::thread> workers_;
+    bool stopping_ = false;
+};
+
+planner_result run_mcts_backend(const planner_request& request,
+                                const planner_model& model,
+                                const std::vector<planner_bound>& bounds,
+                                const planner_action& safe_action,
+                                const std::string& action_schema,
+                                std::chrono::steady_clock::time_point deadline) {
+    planner_result result;
+    result.planner = planner_backend::mcts;
+    result.action = safe_action;
+
+    planner_mcts_config cfg = request.mcts;
+    cfg.gamma = clamp_double(cfg.gamma, 0.0, 1.0);
+    cfg.c_ucb = std::max(0.0, cfg.c_ucb);
+    cfg.pw_k = std::max(0.0, cfg.pw_k);
+    cfg.pw_alpha = std::max(0.0, cfg.pw_alpha);
+    cfg.max_depth = std::max<std::int64_t>(1, cfg.max_depth);
+    cfg.time_check_interval = std::max<std::int64_t>(1, cfg.time_check_interval);
+
+    const std::int64_t iter_cap = std::max<std::int64_t>(
+        1,
+        request.work_max > 0 ? request.work_max : std::max<std::int64_t>(1, cfg.default_iters));
+
+    // Root parallelism: independent trees with derived seeds share the deadline and split the
+    // iteration cap, then their root statistics are pooled. One tree is the plain search.
+    const std::int64_t tree_count =
+        std::clamp<std::int64_t>(cfg.root_parallel, 1, std::min<std::int64_t>(k_mcts_max_root_parallel, iter_cap));
+    std::vector<mcts_tree_search> searches(static_cast<std::size_t>(tree_count));
+    if (tree_count == 1) {
+        searches[0] = run_mcts_tree(request, model, bounds, safe_action, cfg, iter_cap, request.seed, deadline);
+    } else {
+        std::vector<std::exception_ptr> errors(static_cast<std::size_t>(tree_count));
+        const auto run_tree = [&](std::int64_t tree) {
+            const std::size_t slot = static_cast<std::size_t>(tree);
+            const std::int64_t tree_cap = (iter_cap / tree_count) + (tree < (iter_cap % tree_count) ? 1 : 0);
+            try {
+                searches[slot] = run_mcts_tree(request,
+                                               model,
+                                               bounds,
+                                               safe_action,
+                                               cfg,
+                                               tree_cap,
+                                               planner_service::mcts_tree_seed(request.seed, tree),
+                                               deadline);
+            } catch (...) {
+                errors[slot] = std::current_exception();
+            }
+        };
+        // Models that do not declare thread safety get the same trees, searched one at a time.
+        if (model.thread_safe()) {
+            mcts_worker_pool::shared().run(tree_count, run_tree);
+        } else {
+            for (std::int64_t tree = 0; tree < tree_count; ++tree) {
+                run_tree(tree);
+            }
+        }
+        for (const std::exception_ptr& error : errors) {
+            if (error) {
+                std::rethrow_exception(error);
+            }
+        }
+    }
+
+    // Pool root children across trees. Progressive widening samples continuous actions, so
+    // trees almost never share an exact action; with several trees each child is instead
+    // assigned to a cell of a root_merge_bins-per-dimension grid over the action bounds. A cell
+    // sums visits/value over its members and is represented by its most visited member.
+    struct mcts_root_candidate {
+        const planner_vector* action = nullptr;
+        std::int64_t visits = 0;
+        double value_sum = 0.0;
+        std::int64_t action_visits = 0;  // visits of the member whose action represents the cell
+    };
+    const std::int64_t merge_bins = std::max<std::int64_t>(1, cfg.root_merge_bins);
+    const auto merge_cell = [&](const planner_vector& action) {
+        std::vector<std::int64_t> cell(action.size(), 0);
+        for (std::size_t i = 0; i < action.size(); ++i) {
+            const double lo = i < bounds.size() ? bounds[i].lo : -1.0;
+            const double hi = i < bounds.size() ? bounds[i].hi : 1.0;
+            const double span = hi - lo;
+            if (span > 0.0 && std::isfinite(action[i])) {
+                const double scaled = std::floor(((action[i] - lo) / span) * static_cast<double>(merge_bins));
+                cell[i] = std::clamp<std::int64_t>(static_cast<std::int64_t>(scaled), 0, merge_bins - 1);
+            }
+        }
+        return cell;
+    };
+    std::map<std::vector<std::int64_t>, std::size_t> cell_candidates;
+    std::vector<mcts_root_candidate> sorted_children;
+    std::int64_t root_visits = 0;
+    std::int64_t widen_added = 0;
+    std::int64_t completed_iters = 0;
+    bool timed_out = false;
+    for (const mcts_tree_search& search : searches) {
+        root_visits += search.root_visits;
+        widen_added += search.widen_added;
+        completed_iters += search.completed_iters;
+        timed_out = timed_out || search.timed_out;
+        for (const mcts_child& child : search.root_children) {
+            if (tree_count > 1) {
+                const auto [it, inserted] = cell_candidates.emplace(merge_cell(child.action), sorted_children.size());
+                if (!inserted) {
+                    mcts_root_candidate& cell = sorted_children[it->second];
+                    cell.visits += child.visits;
+                    cell.value_sum += child.value_sum;
+                    if (child.visits > cell.action_visits) {
+                        cell.action = &child.action;
+                        cell.action_visits = child.visits;
+                    }
+                    continue;
+                }
+            }
+            sorted_children.push_back(mcts_root_candidate{&child.action, child.visits, child.value_sum, child.visits});
+        }
+    }
+    std::sort(sorted_children.begin(),
+              sorted_children.end(),
+              [](const mcts_root_candidate& lhs, const mcts_root_candidate& rhs) { return lhs.visits > rhs.visits; });
 
     result.trace.mcts.available = true;
-    result.trace.mcts.root_visits = root.visits;
-    result.trace.mcts.root_children = static_cast<std::int64_t>(root.children.size());
+    result.trace.mcts.root_visits = root_visits;
+    result.trace.mcts.root_children = static_cast<std::int64_t>(sorted_children.size());
     result.trace.mcts.widen_added = widen_added;
 
     const std::size_t top_k = static_cast<std::size_t>(std::max<std::int64_t>(0, request.top_k));
     for (std::size_t i = 0; i < sorted_children.size() && i < top_k; ++i) {
-        const mcts_child* child = sorted_children[i];
+        const mcts_root_candidate& child = sorted_children[i];
         planner_top_choice_mcts top;
-        top.action = make_action(action_schema, clamp_action_with_bounds(child->action, bounds, model));
-        top.visits = child->visits;
-        top.q = child->visits > 0 ? child->value_sum / static_cast<double>(child->visits) : 0.0;
+        top.action = make_action(action_schema, clamp_action_with_bounds(*child.action, bounds, model));
+        top.visits = child.visits;
+        top.q = child.visits > 0 ? child.value_sum / static_cast<double>(child.visits) : 0.0;
         result.trace.mcts.top_k.push_back(std::move(top));
     }
 
     if (!sorted_children.empty()) {
-        const mcts_child* best = sorted_children.front();
-        result.action = make_action(action_schema, clamp_action_with_bounds(best->action, bounds, model));
-        result.confidence = root.visits > 0
-                                ? static_cast<double>(best->visits) /
-                                      static_cast<double>(std::max<std::int64_t>(1, root.visits))
+        const mcts_root_candidate& best = sorted_children.front();
+        result.action = make_action(action_schema, clamp_action_with_bounds(*best.action, bounds, model));
+        result.confidence = root_visits > 0
+                                ? static_cast<double>(best.visits) /
+                                      static_cast<double>(std::max<std::int64_t>(1, root_visits))
                                 : 0.0;
         result.status = timed_out ? planner_status::timeout : planner_status::ok;
     } else {
@@ -1885,6 +2188,10 @@ bool planner_model::quadraticise_terminal_cost(const planner_vector&, planner_te
     return false;
 }
 
+bool planner_model::thread_safe() const {
+    return false;
+}
+
 planner_service::planner_service() {
     records_.reserve(record_capacity_);
     register_model("toy-1d", std::make_shared<toy_1d_model>());
@@ -2031,6 +2338,11 @@ std::uint64_t planner_service::derive_seed(std::string_view node_name, std::uint
     return seed == 0 ? 0x9e3779b97f4a7c15ull : seed;
 }
 
+std::uint64_t planner_service::mcts_tree_seed(std::uint64_t seed, std::int64_t tree) noexcept {
+    // Tree 0 keeps the request seed, so a single-tree search is unchanged.
+    return seed + (static_cast<std::uint64_t>(tree) * 0x9e3779b97f4a7c15ull);
+}
+
 std::uint64_t planner_service::hash64(std::string_view text) noexcept {
     std::uint64_t hash = 1469598103934665603ull;
     for (unsigned char c : text) {
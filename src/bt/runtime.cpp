@@ -393,14 +393,16 @@ void emit_log(tick_context& ctx, log_level level, std::string category, std::str
 }
 
 node_profile_stats& node_stats_for(instance& inst, const node& n) {
-    auto it = inst.node_stats.find(n.id);
-    if (it == inst.node_stats.end()) {
-        node_profile_stats stats;
+    if (n.id >= inst.node_stats.size()) {
+        const std::size_t node_count = inst.def ? inst.def->nodes.size() : 0;
+        inst.node_stats.resize(std::max<std::size_t>(static_cast<std::size_t>(n.id) + 1u, node_count));
+    }
+    node_profile_stats& stats = inst.node_stats[n.id];
+    if (stats.name.empty()) {
         stats.id = n.id;
         stats.name = n.leaf_name.empty() ? std::string("node-") + std::to_string(n.id) : n.leaf_name;
-        it = inst.node_stats.emplace(n.id, std::move(stats)).first;
     }
-    return it->second;
+    return stats;
 }
 
 node_memory& node_memory_for(instance& inst, node_id id) {
@@ -1298,6 +1300,14 @@ status execute_plan_action(const node& n, tick_context& ctx, const std::vector<m
             request.mcts.action_sampler = arg_as_text(value, "plan-action :action_sampler");
             continue;
         }
+        if (key == "root_parallel") {
+            request.mcts.root_parallel = arg_as_int(value, "plan-action :root_parallel");
+            continue;
+        }
+        if (key == "root_merge_bins") {
+            request.mcts.root_merge_bins = arg_as_int(value, "plan-action :root_merge_bins");
+            continue;
+        }
 
         if (key == "lambda") {
             request.mppi.lambda = arg_as_number(value, "plan-action :lambda");
@@ -2664,19 +2674,10 @@ std::string dump_stats(const instance& inst) {
     out << "tick_max_ns=" << inst.tree_stats.tick_duration.max.count() << '\n';
     out << "tick_total_ns=" << inst.tree_stats.tick_duration.total.count() << '\n';
 
-    std::vector<node_id> ids;
-    ids.reserve(inst.node_stats.size());
-    for (const auto& [id, _] : inst.node_stats) {
-        ids.push_back(id);
-    }
-    std::sort(ids.begin(), ids.end());
-
-    for (node_id id : ids) {
-        const auto it = inst.node_stats.find(id);
-        if (it == inst.node_stats.end()) {
-            continue;
+    for (const node_profile_stats& n : inst.node_stats) {
+        if (n.name.empty()) {
+            continue;  // slot for a node that has not been ticked yet
         }
-        const node_profile_stats& n = it->second;
         out << "node " << n.id << " (" << n.name << ")"
             << " success=" << n.success_returns << " failure=" << n.failure_returns
             << " running=" << n.running_returns << " last_ns=" << n.tick_duration.last.count()
@@ -3180,6 +3180,10 @@ bt::planner_request parse_planner_request_map(value request_map) {
             map_lookup_text_or(cfg_map, "rollout_policy", request.mcts.rollout_policy, "planner.plan mcts rollout_policy");
         request.mcts.action_sampler =
             map_lookup_text_or(cfg_map, "action_sampler", request.mcts.action_sampler, "planner.plan mcts action_sampler");
+        request.mcts.root_parallel =
+            map_lookup_int_or(cfg_map, "root_parallel", request.mcts.root_parallel, "planner.plan mcts root_parallel");
+        request.mcts.root_merge_bins = map_lookup_int_or(
+            cfg_map, "root_merge_bins", request.mcts.root_merge_bins, "planner.plan mcts root_merge_bins");
     }
 
     if (const std::optional<value> mppi_v = map_lookup_option(request_map, "mppi"); mppi_v.has_value()) {
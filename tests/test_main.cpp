@@ -1,3 +1,5 @@
+#include <algorithm>
+#include <atomic>
 #include <cmath>
 #include <chrono>
 #include <cstdint>
@@ -1750,6 +1752,41 @@ void test_planner_plan_builtin_determinism_bounds_budget_and_sanity() {
     check(is_integer(fields[3]) && integer_value(fields[3]) >= 0, "planner.plan time_used_ms should be non-negative int");
     check(is_integer(fields[4]) && integer_value(fields[4]) > 0, "planner.plan work_done should be positive");
 
+    value root_parallel_out = eval_text(
+        "(begin "
+        "  (define req (map.make)) "
+        "  (map.set! req 'schema_version \"planner.request.v1\") "
+        "  (map.set! req 'planner \"mcts\") "
+        "  (map.set! req 'model_service \"toy-1d\") "
+        "  (map.set! req 'state 0.0) "
+        "  (map.set! req 'seed 42) "
+        "  (map.set! req 'budget_ms 5000) "
+        "  (map.set! req 'work_max 400) "
+        "  (map.set! req 'bounds (list (list -0.4 0.4))) "
+        "  (define mcts (map.make)) "
+        "  (map.set! mcts 'max_depth 16) "
+        "  (map.set! mcts 'root_parallel 3) "
+        "  (map.set! req 'mcts mcts) "
+        "  (define r1 (planner.plan req)) "
+        "  (define r2 (planner.plan req)) "
+        "  (list (car (map.get (map.get r1 'action nil) 'u (list 0.0))) "
+        "        (car (map.get (map.get r2 'action nil) 'u (list 0.0))) "
+        "        (map.get (map.get r1 'stats nil) 'work_done 0) "
+        "        (map.get (map.get r1 'trace nil) 'root_visits 0)))",
+        env);
+    const std::vector<value> root_parallel_fields = vector_from_list(root_parallel_out);
+    check(root_parallel_fields.size() == 4, "planner.plan mcts root_parallel output shape mismatch");
+    check(is_float(root_parallel_fields[0]) && is_float(root_parallel_fields[1]),
+          "planner.plan mcts root_parallel action should be float");
+    check_close(float_value(root_parallel_fields[0]), float_value(root_parallel_fields[1]), 1e-12,
+                "planner.plan mcts root_parallel should be deterministic for fixed seed");
+    check(float_value(root_parallel_fields[0]) >= -0.4 && float_value(root_parallel_fields[0]) <= 0.4,
+          "planner.plan mcts root_parallel should clamp by bounds");
+    check(is_integer(root_parallel_fields[2]) && integer_value(root_parallel_fields[2]) == 400,
+          "planner.plan mcts root_parallel trees should split work_max");
+    check(is_integer(root_parallel_fields[3]) && integer_value(root_parallel_fields[3]) == 400,
+          "planner.plan mcts root_parallel should pool root visits");
+
     value budget_out = eval_text(
         "(begin "
         "  (define req (map.make)) "
@@ -2070,6 +2107,28 @@ void test_plan_action_node_with_all_planner_backends() {
     check(i_ilqr->bb.get("action") != nullptr, "ilqr backend should publish action");
 }
 
+void test_plan_action_node_mcts_root_parallel() {
+    using namespace muslisp;
+
+    reset_bt_runtime_host();
+    env_ptr env = create_global_env();
+
+    (void)eval_text(
+        "(define tree-rp "
+        "  (bt.compile '(plan-action :name \"mcts-rp\" :planner :mcts :budget_ms 24 :work_max 240 "
+        "                          :root_parallel 2 :root_merge_bins 16 "
+        "                          :model_service \"toy-1d\" :state_key state :action_key action)))",
+        env);
+    (void)eval_text("(define inst-rp (bt.new-instance tree-rp))", env);
+    check(symbol_name(eval_text("(bt.tick inst-rp '((state -1.0)))", env)) == "success",
+          "plan-action mcts root_parallel should succeed");
+
+    bt::runtime_host& host = bt::default_runtime_host();
+    bt::instance* inst = host.find_instance(bt_handle(eval_text("inst-rp", env)));
+    check(inst != nullptr, "root_parallel test instance should exist");
+    check(inst->bb.get("action") != nullptr, "mcts root_parallel should publish action");
+}
+
 void test_hash64_builtin() {
     using namespace muslisp;
 
@@ -3166,6 +3225,8 @@ void test_bt_blackboard_events_and_stats_builtins() {
     value stats_dump = eval_text("(bt.stats inst)", env);
     check(is_string(stats_dump), "bt.stats should return string");
     check(string_value(stats_dump).find("tick_count=1") != std::string::npos, "stats should include tick_count=1");
+    check(string_value(stats_dump).find("(bb-put-int) success=1 failure=0 running=0") != std::string::npos,
+          "stats should include per-node returns for ticked leaves");
 
     (void)eval_text("(bt.set-tick-budget-ms inst 1)", env);
     (void)eval_text("(bt.tick inst)", env);
@@ -4150,6 +4211,158 @@ void test_shared_flagship_planner_model_in_core_runtime() {
           "core runtime flagship planner angular_z should stay in range");
 }
 
+void test_planner_mcts_root_parallel_pools_root_statistics() {
+    reset_bt_runtime_host();
+    bt::planner_service& planner = bt::default_runtime_host().planner_ref();
+
+    constexpr std::int64_t k_trees = 4;
+    constexpr std::int64_t k_work = 400;
+    bt::planner_request request;
+    request.schema_version = "planner.request.v1";
+    request.planner = bt::planner_backend::mcts;
+    request.model_service = "toy-1d";
+    request.state = {0.0};
+    request.seed = 3;
+    request.budget_ms = 5000;
+    request.top_k = 1;
+
+    // Each tree of a root-parallel search is the single-tree search with a derived seed and an
+    // even share of work_max, so the trees can be replayed one at a time.
+    std::int64_t best_single_tree_visits = 0;
+    for (std::int64_t tree = 0; tree < k_trees; ++tree) {
+        bt::planner_request single = request;
+        single.seed = bt::planner_service::mcts_tree_seed(request.seed, tree);
+        single.work_max = k_work / k_trees;
+        const bt::planner_result single_result = planner.plan(single);
+        check(!single_result.trace.mcts.top_k.empty(), "single-tree mcts should report a best root child");
+        best_single_tree_visits = std::max(best_single_tree_visits, single_result.trace.mcts.top_k.front().visits);
+    }
+
+    request.work_max = k_work;
+    request.mcts.root_parallel = k_trees;
+    const bt::planner_result pooled = planner.plan(request);
+    check(pooled.status == bt::planner_status::ok, "root-parallel mcts should succeed");
+    check(pooled.stats.work_done == k_work, "root-parallel mcts trees should split work_max");
+    check(pooled.trace.mcts.root_visits == k_work, "root-parallel mcts should pool root visits");
+    check(!pooled.trace.mcts.top_k.empty(), "root-parallel mcts should report a best pooled child");
+    check(pooled.trace.mcts.top_k.front().visits > best_single_tree_visits,
+          "pooled best root child should gather more visits than any single tree's best child");
+}
+
+// Toy 1-D dynamics that records how many step() calls overlap and can optionally run a
+// root-parallel plan from inside step(), as a model backed by another planner would.
+class probe_planner_model final : public bt::planner_model {
+public:
+    probe_planner_model(bool thread_safe, bt::planner_service* nested_planner)
+        : thread_safe_(thread_safe), nested_planner_(nested_planner) {}
+
+    bt::planner_step_result step(const bt::planner_vector& state,
+                                 const bt::planner_vector& action,
+                                 bt::planner_rng&) const override {
+        const std::int64_t active = active_calls_.fetch_add(1) + 1;
+        std::int64_t seen = max_active_calls_.load();
+        while (active > seen && !max_active_calls_.compare_exchange_weak(seen, active)) {
+        }
+        if (nested_planner_ != nullptr) {
+            bt::planner_request nested;
+            nested.schema_version = "planner.request.v1";
+            nested.planner = bt::planner_backend::mcts;
+            nested.model_service = "toy-1d";
+            nested.state = state;
+            nested.seed = 11;
+            nested.budget_ms = 5000;
+            nested.work_max = 8;
+            nested.mcts.max_depth = 2;
+            nested.mcts.root_parallel = 4;
+            (void)nested_planner_->plan(nested);
+        }
+        const double x = state.empty() ? 0.0 : state[0];
+        const double x2 = x + 0.25 * std::clamp(action.empty() ? 0.0 : action[0], -1.0, 1.0);
+        bt::planner_step_result out;
+        out.next_state = {x2};
+        out.reward = -((1.0 - x2) * (1.0 - x2));
+        active_calls_.fetch_sub(1);
+        return out;
+    }
+
+    bt::planner_vector sample_action(const bt::planner_vector&, bt::planner_rng& rng) const override {
+        return {rng.uniform(-1.0, 1.0)};
+    }
+
+    bt::planner_vector clamp_action(const bt::planner_vector& action) const override {
+        return {std::clamp(action.empty() ? 0.0 : action[0], -1.0, 1.0)};
+    }
+
+    bt::planner_vector zero_action() const override {
+        return {0.0};
+    }
+
+    std::size_t action_dims() const override {
+        return 1;
+    }
+
+    std::vector<bt::planner_bound> action_bounds() const override {
+        return {{-1.0, 1.0}};
+    }
+
+    bool thread_safe() const override {
+        return thread_safe_;
+    }
+
+    [[nodiscard]] std::int64_t max_active_calls() const {
+        return max_active_calls_.load();
+    }
+
+private:
+    bool thread_safe_ = false;
+    bt::planner_service* nested_planner_ = nullptr;
+    mutable std::atomic<std::int64_t> active_calls_{0};
+    mutable std::atomic<std::int64_t> max_active_calls_{0};
+};
+
+void test_planner_mcts_root_parallel_threading_rules() {
+    reset_bt_runtime_host();
+    bt::planner_service& planner = bt::default_runtime_host().planner_ref();
+    auto serial_model = std::make_shared<probe_planner_model>(false, nullptr);
+    auto parallel_model = std::make_shared<probe_planner_model>(true, nullptr);
+    auto nesting_model = std::make_shared<probe_planner_model>(true, &planner);
+    planner.register_model("probe-serial", serial_model);
+    planner.register_model("probe-parallel", parallel_model);
+    planner.register_model("probe-nesting", nesting_model);
+
+    bt::planner_request request;
+    request.schema_version = "planner.request.v1";
+    request.planner = bt::planner_backend::mcts;
+    request.state = {0.0};
+    request.seed = 5;
+    request.budget_ms = 5000;
+    request.work_max = 200;
+    request.top_k = 1;
+    request.mcts.root_parallel = 4;
+
+    // A model that does not declare thread safety is never called concurrently, and still gets
+    // the same trees as a thread-safe one because work_max ends the search.
+    request.model_service = "probe-serial";
+    const bt::planner_result serial = planner.plan(request);
+    request.model_service = "probe-parallel";
+    const bt::planner_result parallel = planner.plan(request);
+    check(serial.status == bt::planner_status::ok && parallel.status == bt::planner_status::ok,
+          "root-parallel mcts should succeed for serial and thread-safe models");
+    check(serial_model->max_active_calls() == 1, "non-thread-safe model should not be stepped concurrently");
+    check(serial.action.u == parallel.action.u, "serial root-parallel trees should match the concurrent search");
+    check(serial.trace.mcts.root_visits == parallel.trace.mcts.root_visits,
+          "serial root-parallel trees should pool the same root visits");
+
+    // Root-parallel plans issued from inside pool tasks must not wait on jobs queued behind
+    // themselves; nested searches run serially on the calling thread.
+    request.model_service = "probe-nesting";
+    request.work_max = 16;
+    request.mcts.max_depth = 2;
+    const bt::planner_result nested = planner.plan(request);
+    check(nested.status == bt::planner_status::ok, "nested root-parallel mcts should complete");
+    check(nested.stats.work_done == 16, "nested root-parallel mcts should finish its work");
+}
+
 void test_env_run_loop_multi_episode_reset_true() {
     using namespace muslisp;
 
@@ -5232,6 +5445,7 @@ int main() {
         {"planner.plan determinism/bounds/budget/sanity", test_planner_plan_builtin_determinism_bounds_budget_and_sanity},
         {"plan-action node blackboard/meta/logs", test_plan_action_node_blackboard_meta_and_logs},
         {"plan-action node all planner backends", test_plan_action_node_with_all_planner_backends},
+        {"plan-action node mcts root_parallel", test_plan_action_node_mcts_root_parallel},
         {"hash64 builtin", test_hash64_builtin},
         {"json and handle builtins", test_json_and_handle_builtins},
         {"capability registry call echo", test_capability_registry_call_echo},
@@ -5277,6 +5491,8 @@ int main() {
         {"racecar planner model + env.api contract", test_racecar_planner_model_and_env_api_contract},
 #endif
         {"shared flagship planner model in core runtime", test_shared_flagship_planner_model_in_core_runtime},
+        {"planner mcts root-parallel pools root statistics", test_planner_mcts_root_parallel_pools_root_statistics},
+        {"planner mcts root-parallel threading rules", test_planner_mcts_root_parallel_threading_rules},
 #if MUESLI_BT_WITH_ROS2_INTEGRATION
         {"env generic ros2 backend contract", test_env_generic_ros2_backend_contract},
         {"ros2 backend config validation and reset policy", test_ros2_backend_config_validation_and_reset_policy},